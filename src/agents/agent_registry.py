@@ -1,8 +1,7 @@
 import asyncio
 import json
 from typing import Dict, List, Optional, Any
-import redis.asyncio as redis
-from src.utils.config import Config
+from src.mcp_server import redis_client
 
 class AgentRegistry:
     """
@@ -19,11 +18,7 @@ class AgentRegistry:
         """
         Initialize the agent registry with Redis connection.
         """
-        self.redis = redis.Redis(
-            host=Config.REDIS_HOST,
-            port=Config.REDIS_PORT,
-            db=Config.REDIS_DB
-        )
+        self.redis = redis_client.get_client()
     
     async def register_agent(self, agent_info: Dict[str, Any]) -> bool:
         """
@@ -2,12 +2,14 @@ import asyncio
 import json
 import uuid
 from datetime import datetime
-from typing import Dict, List, Optional, Any
-import redis.asyncio as redis
-from src.utils.config import Config
+from typing import Dict, List, Optional, Any, Union
+from src.mcp_server import redis_client
 from src.utils.claude_client import ClaudeClient
 from src.mcp_server.message_bus import MessageBus
-from src.models.message_models import Message, TaskAssignmentMessage, TaskStatusUpdateMessage, TaskResultMessage
+from src.utils.bus_batcher import MessageBatcher
+from src.models.message_models import (
+    Message, TaskAssignmentMessage, TaskStatusUpdateMessage, TaskResultMessage, KnowledgeQueryMessage
+)
 
 
 class BaseAgent:
@@ -31,11 +33,7 @@ class BaseAgent:
         """
         self.agent_type = agent_type
         self.agent_id = agent_id or f"{agent_type}_{str(uuid.uuid4())[:8]}"
-        self.redis = redis.Redis(
-            host=Config.REDIS_HOST,
-            port=Config.REDIS_PORT,
-            db=Config.REDIS_DB
-        )
+        self.redis = redis_client.get_client()
         self.claude = ClaudeClient()
         self.running = False
         self.current_task = None
@@ -70,25 +68,29 @@ class BaseAgent:
         self.message_bus = MessageBus()
         await self.message_bus.initialize()
 
+        # Outbound messages are sent in batches
+        self.message_batcher = MessageBatcher(self.message_bus)
+        self.message_batcher.start()
+
         # Register message handlers
         await self.message_bus.register_handler("task_assignment", self.handle_task_assignment)
         await self.message_bus.register_handler("knowledge_response", self.handle_knowledge_response)
 
-    async def send_message(self, message: Dict[str, Any]) -> str:
+    async def send_message(self, message: Union[Dict[str, Any], Message]) -> str:
         """
         Send a message to another agent or the MCP.
 
         Args:
-            message: Dictionary containing the message data
+            message: Message model or dictionary containing the message data
 
         Returns: Message ID of the sent message
         """
         # Add sender information if not present
-        if "sender_id" not in message:
+        if isinstance(message, dict) and "sender_id" not in message:
             message["sender_id"] = self.agent_id
 
-        # Send via message bus
-        return await self.message_bus.send_message(message)
+        # Queue for the next batched send on the message bus
+        return await self.message_batcher.submit(message)
 
     async def handle_task_assignment(self, message: Dict[str, Any]):
         """
@@ -130,17 +132,17 @@ class BaseAgent:
             await self.store_result(task_id, result)
 
             # Send task result message
-            await self.send_message({
-                "message_type": "task_result",
-                "recipient_id": message.get("sender_id"),
-                "reply_to": message.get("message_id"),
-                "content": {
+            await self.send_message(TaskResultMessage.build_trusted(
+                sender_id=self.agent_id,
+                recipient_id=message.get("sender_id"),
+                reply_to=message.get("message_id"),
+                content={
                     "task_id": task_id,
                     "status": "success",
                     "result": result,
                     "summary": result.get("summary", "Task completed")
                 }
-            })
+            ))
 
         except Exception as e:
             print(f"Error processing assigned task: {e}")
@@ -179,15 +181,15 @@ class BaseAgent:
 
         Returns: Message ID of the query message
         """
-        return await self.send_message({
-            "message_type": "knowledge_query",
-            "recipient_id": "knowledge_base_agent",  # Special agent ID for knowledge base
-            "content": {
+        return await self.send_message(KnowledgeQueryMessage.build_trusted(
+            sender_id=self.agent_id,
+            recipient_id="knowledge_base_agent",  # Special agent ID for knowledge base
+            content={
                 "query": query,
                 "collection": collection,
                 "n_results": n_results
             }
-        })
+        ))
     
     def get_capabilities(self) -> List[str]:
         """
@@ -413,7 +415,11 @@ class BaseAgent:
         Stop the agent's processing loop.
         
         Sets the running flag to False, which will cause the main loop
-        to exit once the current task is completed.
+        to exit once the current task is completed, and flushes any
+        queued outbound messages.
         """
         self.running = False
 
+        if getattr(self, "message_batcher", None):
+            await self.message_batcher.stop()
+
@@ -3,6 +3,7 @@ import json
 from typing import Dict, List, Any
 from src.agents.base_agent import BaseAgent
 from src.knowledge_base.security_kb import SecurityKnowledgeBase
+from src.models.message_models import KnowledgeResponseMessage
 
 
 class KnowledgeBaseAgent(BaseAgent):
@@ -100,16 +101,16 @@ class KnowledgeBaseAgent(BaseAgent):
         formatted_results = self._format_query_results(results)
 
         # Send response
-        await self.send_message({
-            "message_type": "knowledge_response",
-            "recipient_id": message.get("sender_id"),
-            "reply_to": message.get("message_id"),
-            "content": {
+        await self.send_message(KnowledgeResponseMessage.build_trusted(
+            sender_id=self.agent_id,
+            recipient_id=message.get("sender_id"),
+            reply_to=message.get("message_id"),
+            content={
                 "query": query_text,
                 "collection": collection,
                 "results": formatted_results
             }
-        })
+        ))
 
     def _format_query_results(self, results):
         """
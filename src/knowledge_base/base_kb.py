@@ -3,7 +3,7 @@ import chromadb
 from chromadb.config import Settings
 from sentence_transformers import SentenceTransformer
 from typing import Dict, List, Optional, Any
-from src.utils.config import Config
+from src.utils.config import get_config
 
 class BaseKnowledgeBase:
     """
@@ -18,9 +18,10 @@ class BaseKnowledgeBase:
         Initialize the knowledge base with ChromaDB connection and embedding model.
         """
         # Connect to ChromaDB
+        config = get_config()
         self.client = chromadb.HttpClient(
-            host=Config.CHROMA_HOST,
-            port=Config.CHROMA_PORT
+            host=config.CHROMA_HOST,
+            port=config.CHROMA_PORT
         )
         
         # Initialize embedding model
@@ -107,8 +108,8 @@ class BaseKnowledgeBase:
         if not collection:
             collection = self.create_collection(collection_name)
         
-        # Generate embeddings
-        embeddings = [self.get_embedding(text) for text in texts]
+        # Generate embeddings for the whole batch in one model call
+        embeddings = self.embedding_model.encode(texts).tolist()
         
         # Add to collection
         collection.add(
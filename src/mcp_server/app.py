@@ -1,17 +1,19 @@
-from fastapi import FastAPI, HTTPException, Depends, BackgroundTasks, WebSocket, WebSocketDisconnect
+from fastapi import FastAPI, HTTPException, Depends, BackgroundTasks, WebSocket, WebSocketDisconnect, Request, Response
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from fastapi.middleware.cors import CORSMiddleware
 import uvicorn
+import functools
+import secrets
 import uuid
 import json
 from datetime import datetime
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError
 from typing import Dict, List, Optional, Any
-from redis_client import RedisClient
+from src.mcp_server.redis_client import RedisClient
 from src.mcp_server.ws_handler import connection_manager
 from src.mcp_server.task_queue import TaskQueue
-from src.utils.config import Config
-from src.models.task_models import TaskCreate, TaskResponse, TaskStatus, TaskResult
+from src.utils.config import get_config
+from src.models.task_models import TaskCreate, TaskResponse, TaskStatus, TaskResult, TaskStatusAdapter
 from src.agents.agent_registry import AgentRegistry
 from src.knowledge_base.importers.security_data_importer import SecurityDataImporter
 from src.knowledge_base.security_kb import SecurityKnowledgeBase
@@ -40,6 +42,21 @@ app.add_middleware(
 # Set up authentication
 security = HTTPBearer()
 
+@functools.lru_cache(maxsize=1024)
+def verify_token(token: str) -> bool:
+    """
+    Check a bearer token against the configured auth token.
+    
+    Results are cached per token, so repeated requests with the same
+    token skip the comparison.
+    
+    Args:
+        token: Bearer token from the request
+        
+    Returns: True if the token is valid
+    """
+    return secrets.compare_digest(token.encode(), get_config().AUTH_TOKEN.encode())
+
 # Initialize task queue
 task_queue = TaskQueue()
 
@@ -83,7 +100,7 @@ async def create_task(
     background_tasks: BackgroundTasks = None
 ):
     # Validate token
-    if credentials.credentials != Config.AUTH_TOKEN:
+    if not verify_token(credentials.credentials):
         raise HTTPException(status_code=401, detail="Invalid token")
     
     # Convert to dict
@@ -105,7 +122,7 @@ async def get_task(
     credentials: HTTPAuthorizationCredentials = Depends(security)
 ):
     # Validate token
-    if credentials.credentials != Config.AUTH_TOKEN:
+    if not verify_token(credentials.credentials):
         raise HTTPException(status_code=401, detail="Invalid token")
     
     # Get task from Redis via the task queue
@@ -124,14 +141,29 @@ async def get_task(
     
     return response
 
+def task_status_etag(task_id: str, task: Dict[str, Any]) -> str:
+    """
+    Compute the ETag of a task's status.
+    
+    Args:
+        task_id: ID of the task
+        task: Task data as stored in Redis
+        
+    Returns: Quoted ETag value that changes whenever the status does
+    """
+    version = f"{task_id}:{task.get('status')}:{task.get('progress')}:{task.get('updated_at')}"
+    return f'"{version}"'
+
 # Add endpoint to get task status
 @app.get("/api/task/{task_id}/status", response_model=TaskStatus)
 async def get_task_status(
     task_id: str,
+    request: Request,
+    response: Response,
     credentials: HTTPAuthorizationCredentials = Depends(security)
 ):
     # Validate token
-    if credentials.credentials != Config.AUTH_TOKEN:
+    if not verify_token(credentials.credentials):
         raise HTTPException(status_code=401, detail="Invalid token")
     
     # Get task
@@ -139,6 +171,12 @@ async def get_task_status(
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
     
+    # Unchanged since the client's last poll: skip building the response body
+    etag = task_status_etag(task_id, task)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    
     return TaskStatus(
         task_id=task_id,
         status=task.get("status", "unknown"),
@@ -156,7 +194,7 @@ async def update_task_status(
     credentials: HTTPAuthorizationCredentials = Depends(security)
 ):
     # Validate token
-    if credentials.credentials != Config.AUTH_TOKEN:
+    if not verify_token(credentials.credentials):
         raise HTTPException(status_code=401, detail="Invalid token")
    
     # Get task
@@ -164,12 +202,23 @@ async def update_task_status(
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
       
+    # Validate the update merged over the current status
+    try:
+        task_status = TaskStatusAdapter.validate_python({
+            "task_id": task_id,
+            "status": status_update.get("status", task.get("status")),
+            "progress": status_update.get("progress", task.get("progress", 0.0)),
+            "message": status_update.get("message", "")
+        })
+    except ValidationError as e:
+        raise HTTPException(status_code=400, detail=e.errors(include_url=False))
+    
     # Update status
     success = await task_queue.update_task_status(
         task_id=task_id,
-        status=status_update.get("status", task.get("status")),
-        progress=status_update.get("progress", task.get("progress", 0.0)),
-        message=status_update.get("message", "")
+        status=task_status.status,
+        progress=task_status.progress,
+        message=task_status.message
     )
     
     if not success:
@@ -184,7 +233,7 @@ async def get_active_tasks(
     credentials: HTTPAuthorizationCredentials = Depends(security)
 ):
     # Validate token
-    if credentials.credentials != Config.AUTH_TOKEN:
+    if not verify_token(credentials.credentials):
         raise HTTPException(status_code=401, detail="Invalid token")
     
     # Get active tasks
@@ -220,6 +269,10 @@ async def startup_event():
     await message_bus.initialize()
     print("Message bus initialized")
 
+    # Start the workflow task dispatcher
+    await workflow_orchestrator.initialize()
+    print("Workflow orchestrator initialized")
+
     # Initialize security knowledge base
     try:
         kb = SecurityKnowledgeBase()
@@ -256,7 +309,7 @@ async def register_agent(
     Agents call this endpoint to announce their existence and capabilities.
     """
     # Validate token
-    if credentials.credentials != Config.AUTH_TOKEN:
+    if not verify_token(credentials.credentials):
         raise HTTPException(status_code=401, detail="Invalid token")
     
     # Register agent
@@ -276,7 +329,7 @@ async def get_all_agents(
     Returns information about all agents currently registered with the system.
     """
     # Validate token
-    if credentials.credentials != Config.AUTH_TOKEN:
+    if not verify_token(credentials.credentials):
         raise HTTPException(status_code=401, detail="Invalid token")
     
     # Get all agents
@@ -296,7 +349,7 @@ async def get_agents_by_type(
     Returns information about all agents of a specific type (e.g., reconnaissance).
     """
     # Validate token
-    if credentials.credentials != Config.AUTH_TOKEN:
+    if not verify_token(credentials.credentials):
         raise HTTPException(status_code=401, detail="Invalid token")
     
     # Get agents by type
@@ -315,7 +368,7 @@ async def unregister_agent(
     Removes an agent from the registry, typically called when an agent shuts down.
     """
     # Validate token
-    if credentials.credentials != Config.AUTH_TOKEN:
+    if not verify_token(credentials.credentials):
         raise HTTPException(status_code=401, detail="Invalid token")
     
     # Unregister agent
@@ -337,7 +390,7 @@ async def update_agent_status(
     Updates the status of an agent (e.g., idle, busy, offline).
     """
     # Validate token
-    if credentials.credentials != Config.AUTH_TOKEN:
+    if not verify_token(credentials.credentials):
         raise HTTPException(status_code=401, detail="Invalid token")
     
     # Check if status is provided
@@ -364,7 +417,7 @@ async def create_recon_vuln_workflow(
     reconnaissance task with a vulnerability discovery task.
     """
     # Validate token
-    if credentials.credentials != Config.AUTH_TOKEN:
+    if not verify_token(credentials.credentials):
         raise HTTPException(status_code=401, detail="Invalid token")
 
     # Validate required fields
@@ -395,7 +448,7 @@ async def get_workflow(
     Returns information about the workflow and its tasks.
     """
     # Validate token
-    if credentials.credentials != Config.AUTH_TOKEN:
+    if not verify_token(credentials.credentials):
         raise HTTPException(status_code=401, detail="Invalid token")
 
     # Get workflow
@@ -417,7 +470,7 @@ async def get_workflow_results(
     Returns the results of all tasks in the workflow.
     """
     # Validate token
-    if credentials.credentials != Config.AUTH_TOKEN:
+    if not verify_token(credentials.credentials):
         raise HTTPException(status_code=401, detail="Invalid token")
 
     # Get workflow results
@@ -439,7 +492,7 @@ async def get_workflow_report(
     Returns an HTML security assessment report based on workflow results.
     """
     # Validate token
-    if credentials.credentials != Config.AUTH_TOKEN:
+    if not verify_token(credentials.credentials):
         raise HTTPException(status_code=401, detail="Invalid token")
 
     # Get workflow results
@@ -1,11 +1,21 @@
 import asyncio
-import json
+import time
 import uuid
+import orjson
+from pydantic import ValidationError
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Callable
-import redis.asyncio as redis
-from src.utils.config import Config
-from src.models.message_models import Message
+from typing import Dict, List, Optional, Any, Callable, Union
+from src.mcp_server import redis_client
+from src.models.message_models import BusAdapter, Message
+
+# Seconds a stored message is kept
+MESSAGE_TTL = 86400
+
+# Sorted set of message IDs scored by send time, for newest-first listing
+MESSAGE_INDEX_KEY = "messages:by_time"
+
+# Score increment between messages sent in the same batch (1 microsecond)
+INDEX_SCORE_STEP = 1e-6
 
 
 class MessageBus:
@@ -20,11 +30,7 @@ class MessageBus:
         """
         Initialize the message bus with Redis connection.
         """
-        self.redis = redis.Redis(
-            host=Config.REDIS_HOST,
-            port=Config.REDIS_PORT,
-            db=Config.REDIS_DB
-        )
+        self.redis = redis_client.get_client()
         self.pubsub = self.redis.pubsub()
         self.handlers: Dict[str, List[Callable]] = {}
 
@@ -34,44 +40,81 @@ class MessageBus:
 
         Sets up Redis pub/sub subscription and starts the message listener.
         """
-        await self.pubsub.subscribe("agent_messages")
+        await self.pubsub.subscribe(agent_messages=self._on_agent_message)
 
         # Start listening for messages
         asyncio.create_task(self._message_listener())
 
-    async def send_message(self, message: Dict[str, Any]) -> str:
+    async def send_message(self, message: Union[Dict[str, Any], Message]) -> str:
         """
         Send a message to the bus.
 
         Args:
-            message: Dictionary containing the message data
+            message: Message model or dictionary containing the message data
 
         Returns: Message ID of the sent message
         """
+        message = self.prepare_message(message)
+        await self.send_messages([message])
+        return message["message_id"]
+
+    def prepare_message(self, message: Union[Dict[str, Any], Message]) -> Dict[str, Any]:
+        """
+        Normalize a message into a dictionary ready to be sent.
+
+        Args:
+            message: Message model or dictionary containing the message data
+
+        Returns: Message dictionary with message_id and timestamp set
+        """
+        if isinstance(message, Message):
+            # Shallow field copy; orjson serializes UUIDs and datetimes natively
+            message = dict(message)
+
         # Ensure message has ID and timestamp
         if "message_id" not in message:
             message["message_id"] = str(uuid.uuid4())
+        else:
+            message["message_id"] = str(message["message_id"])
 
         if "timestamp" not in message:
             message["timestamp"] = datetime.now().isoformat()
 
-        # Store message in Redis
-        await self.redis.set(
-            f"message:{message['message_id']}",
-            json.dumps(message),
-            ex=86400  # Expire after 24 hours
-        )
-
-        # Publish notification
-        await self.redis.publish("agent_messages", json.dumps({
-            "event": "new_message",
-            "message_id": message["message_id"],
-            "sender_id": message.get("sender_id"),
-            "recipient_id": message.get("recipient_id"),
-            "message_type": message.get("message_type")
-        }))
+        return message
 
-        return message["message_id"]
+    async def send_messages(self, messages: List[Dict[str, Any]]):
+        """
+        Store and announce prepared messages in a single round trip.
+
+        Args:
+            messages: Message dictionaries returned by prepare_message
+        """
+        now = time.time()
+
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for i, message in enumerate(messages):
+                # Store message in Redis
+                pipe.set(
+                    f"message:{message['message_id']}",
+                    orjson.dumps(message, option=orjson.OPT_NON_STR_KEYS),
+                    ex=MESSAGE_TTL
+                )
+                # Offset by batch position so a batch keeps its send order
+                pipe.zadd(MESSAGE_INDEX_KEY, {message["message_id"]: now + i * INDEX_SCORE_STEP})
+
+                # Publish notification
+                pipe.publish("agent_messages", orjson.dumps({
+                    "event": "new_message",
+                    "message_id": message["message_id"],
+                    "sender_id": message.get("sender_id"),
+                    "recipient_id": message.get("recipient_id"),
+                    "message_type": message.get("message_type")
+                }))
+
+            # Drop index entries whose messages have expired
+            pipe.zremrangebyscore(MESSAGE_INDEX_KEY, "-inf", now - MESSAGE_TTL)
+
+            await pipe.execute()
 
     async def get_message(self, message_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -84,13 +127,16 @@ class MessageBus:
         """
         message_data = await self.redis.get(f"message:{message_id}")
         if message_data:
-            return json.loads(message_data)
+            return orjson.loads(message_data)
         return None
 
     async def register_handler(self, message_type: str, handler: Callable):
         """
         Register a handler for a message type.
 
+        Handlers receive messages decoded through BusAdapter, so only the
+        message types in BusMessage are delivered.
+
         Args:
             message_type: Type of message to handle
             handler: Callback function that processes messages of this type
@@ -104,35 +150,64 @@ class MessageBus:
         """
         Listen for messages and dispatch to handlers.
 
-        This method runs in a background task and continuously listens
-        for new messages, dispatching them to registered handlers.
+        This method runs in a background task and blocks on the pub/sub
+        connection, handing each notification to _on_agent_message.
         """
         while True:
             try:
-                message = await self.pubsub.get_message(ignore_subscribe_messages=True)
-                if message and message["type"] == "message":
-                    data = json.loads(message["data"].decode("utf-8"))
-
-                    if data.get("event") == "new_message":
-                        message_id = data.get("message_id")
-                        message_data = await self.get_message(message_id)
-
-                        if message_data:
-                            # Dispatch to handlers
-                            message_type = message_data.get("message_type")
-                            if message_type in self.handlers:
-                                for handler in self.handlers[message_type]:
-                                    try:
-                                        await handler(message_data)
-                                    except Exception as e:
-                                        print(f"Error in message handler: {e}")
-
-                # Small delay to prevent CPU overuse
-                await asyncio.sleep(0.01)
+                await self.pubsub.run()
             except Exception as e:
                 print(f"Error in message listener: {e}")
                 await asyncio.sleep(1)  # Delay before retry
 
+    async def _on_agent_message(self, message: Dict[str, Any]):
+        """
+        Load a newly published message and pass it to registered handlers.
+
+        Args:
+            message: Pubsub data message from the agent_messages channel
+        """
+        data = orjson.loads(message["data"])
+        if data.get("event") != "new_message":
+            return
+
+        # The notification carries the type, so skip the fetch if nobody listens
+        handlers = self.handlers.get(data.get("message_type"))
+        if not handlers:
+            return
+
+        raw = await self.redis.get(f"message:{data.get('message_id')}")
+        if not raw:
+            return
+
+        message_data = self.decode_message(raw)
+        if message_data is None:
+            return
+
+        # Dispatch to handlers
+        for handler in handlers:
+            try:
+                await handler(message_data)
+            except Exception as e:
+                print(f"Error in message handler: {e}")
+
+    @staticmethod
+    def decode_message(raw: Union[bytes, str]) -> Optional[Dict[str, Any]]:
+        """
+        Validate a stored message against its message type.
+
+        Args:
+            raw: JSON-encoded message as stored by send_messages
+
+        Returns: Validated message as a JSON-compatible dictionary, or None
+            if the payload doesn't match any known message type
+        """
+        try:
+            return BusAdapter.validate_json(raw).model_dump(mode="json")
+        except ValidationError as e:
+            print(f"Discarding invalid message: {e}")
+            return None
+
     async def get_messages_for_agent(
             self,
             agent_id: str,
@@ -153,7 +228,7 @@ class MessageBus:
         for key in message_keys:
             message_data = await self.redis.get(key)
             if message_data:
-                message = json.loads(message_data)
+                message = orjson.loads(message_data)
                 if message.get("recipient_id") == agent_id or message.get("sender_id") == agent_id:
                     messages.append(message)
 
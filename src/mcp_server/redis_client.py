@@ -1,15 +1,33 @@
+import functools
 import redis.asyncio as redis
 import json
 from typing import Dict, Any, Optional
-from src.utils.config import Config
+from src.utils.config import get_config
+
+@functools.lru_cache(maxsize=1)
+def get_client() -> redis.Redis:
+    """
+    Shared client backed by one connection pool, so every component in the
+    process reuses the same set of sockets instead of each opening its own.
+    
+    Built on first use rather than at import so importing this module
+    doesn't load the configuration.
+    
+    Returns: Process-wide Redis client
+    """
+    config = get_config()
+    pool = redis.BlockingConnectionPool(
+        host=config.REDIS_HOST,
+        port=config.REDIS_PORT,
+        db=config.REDIS_DB,
+        max_connections=config.REDIS_MAX_CONNECTIONS,
+        timeout=config.REDIS_POOL_TIMEOUT
+    )
+    return redis.Redis(connection_pool=pool)
 
 class RedisClient:
     def __init__(self):
-        self.redis = redis.Redis(
-            host=Config.REDIS_HOST,
-            port=Config.REDIS_PORT,
-            db=Config.REDIS_DB
-        )
+        self.redis = get_client()
     
     async def is_connected(self) -> bool:
         """Check if connected to Redis"""
@@ -1,5 +1,5 @@
 import json
-from typing import Dict, Any
+from typing import Dict, Any, Iterator, TextIO
 from datetime import datetime
 
 
@@ -20,6 +20,33 @@ class ReportGenerator:
 
         Returns: HTML report content
         """
+        return "".join(ReportGenerator.generate_html_report_chunks(workflow_results))
+
+    @staticmethod
+    def generate_html_report_stream(workflow_results: Dict[str, Any], file: TextIO):
+        """
+        Write an HTML security assessment report to a file as it is generated.
+
+        Args:
+            workflow_results: Results from a completed workflow
+            file: Writable text file; should be buffered since chunks are small
+        """
+        for chunk in ReportGenerator.generate_html_report_chunks(workflow_results):
+            file.write(chunk)
+
+    @staticmethod
+    def generate_html_report_chunks(workflow_results: Dict[str, Any]) -> Iterator[str]:
+        """
+        Generate an HTML security assessment report piece by piece.
+
+        Yields the document head and summary, then one chunk per service
+        section (including its vulnerability rows), then the footer.
+
+        Args:
+            workflow_results: Results from a completed workflow
+
+        Returns: Iterator over HTML report chunks
+        """
         # Extract key information
         target = workflow_results.get("target", "Unknown target")
         workflow_id = workflow_results.get("workflow_id", "Unknown workflow")
@@ -42,7 +69,7 @@ class ReportGenerator:
         summary = vuln_result.get("summary", "No summary available.")
 
         # Create HTML content
-        html = f"""
+        yield f"""
         <!DOCTYPE html>
         <html lang="en">
         <head>
@@ -201,7 +228,7 @@ class ReportGenerator:
             version = service.get("version", "Unknown version")
             port = service.get("port", "Unknown port")
 
-            html += f"""
+            section = [f"""
                     <h3>{service_name} {version} (Port {port})</h3>
                     <p>Found {service.get('total_vulnerabilities', 0)} vulnerabilities.</p>
 
@@ -215,7 +242,7 @@ class ReportGenerator:
                             </tr>
                         </thead>
                         <tbody>
-            """
+            """]
 
             # Add rows for each vulnerability
             for vuln in service.get("vulnerabilities", []):
@@ -226,22 +253,23 @@ class ReportGenerator:
 
                 risk_class = f"risk-{risk_level.lower()}"
 
-                html += f"""
+                section.append(f"""
                             <tr>
                                 <td>{name}</td>
                                 <td>{cve_id}</td>
                                 <td><span class="risk-level {risk_class}">{risk_level}</span></td>
                                 <td>{cvss_score}</td>
                             </tr>
-                """
+                """)
 
-            html += """
+            section.append("""
                         </tbody>
                     </table>
-            """
+            """)
+            yield "".join(section)
 
         # Complete the HTML document
-        html += f"""
+        yield f"""
                 </section>
 
                 <footer>
@@ -251,6 +279,4 @@ class ReportGenerator:
             </div>
         </body>
         </html>
-        """
-
-        return html
\ No newline at end of file
+        """
\ No newline at end of file
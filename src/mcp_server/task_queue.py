@@ -3,21 +3,28 @@ import json
 import uuid
 from datetime import datetime
 from typing import Dict, List, Optional, Any
-import redis.asyncio as redis
-from src.utils.config import Config
+from src.mcp_server import redis_client
+
+# Keys per SCAN step and per MGET batch
+SCAN_BATCH_SIZE = 500
+
+# Atomically pop the next task ID from a queue and return it with its data
+POP_TASK_SCRIPT = """
+local task_id = redis.call('RPOP', KEYS[1])
+if not task_id then
+    return nil
+end
+return {task_id, redis.call('GET', 'task:' .. task_id)}
+"""
 
 class TaskQueue:
     def __init__(self):
-        self.redis = redis.Redis(
-            host=Config.REDIS_HOST,
-            port=Config.REDIS_PORT,
-            db=Config.REDIS_DB
-        )
-        self.pubsub = self.redis.pubsub()
+        self.redis = redis_client.get_client()
+        self._pop_task = self.redis.register_script(POP_TASK_SCRIPT)
     
     async def initialize(self):
         """Initialize the task queue"""
-        await self.pubsub.subscribe("task_updates")
+        await self.redis.ping()
     
     async def enqueue_task(self, task_data: Dict[str, Any]) -> str:
         """Add a task to the queue"""
@@ -61,6 +68,49 @@ class TaskQueue:
         if not task_data:
             return False
         
+        self._apply_status(task_data, status, agent_id, progress, message)
+        
+        # Store updated task and publish update in one round trip
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.set(f"task:{task_id}", json.dumps(task_data))
+            pipe.publish("task_updates", self._status_event(task_id, status))
+            await pipe.execute()
+        
+        return True
+    
+    async def store_task_result(self, task_id: str, result_data: Dict[str, Any]) -> bool:
+        """Store task result"""
+        result_data["task_id"] = task_id
+        result_data["timestamp"] = datetime.now().isoformat()
+        
+        task_data = await self.get_task(task_id)
+        
+        # Store result, mark task as completed and publish both updates atomically
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.set(f"result:{task_id}", json.dumps(result_data))
+            
+            if task_data:
+                self._apply_status(task_data, "completed", progress=100.0)
+                pipe.set(f"task:{task_id}", json.dumps(task_data))
+                pipe.publish("task_updates", self._status_event(task_id, "completed"))
+            
+            pipe.publish("task_updates", json.dumps({
+                "event": "task_completed",
+                "task_id": task_id,
+                "timestamp": datetime.now().isoformat()
+            }))
+            await pipe.execute()
+        
+        return True
+    
+    @staticmethod
+    def _apply_status(
+        task_data: Dict[str, Any], status: str,
+        agent_id: Optional[str] = None,
+        progress: Optional[float] = None,
+        message: Optional[str] = None
+    ):
+        """Apply a status change to task data in place"""
         task_data["status"] = status
         task_data["updated_at"] = datetime.now().isoformat()
         
@@ -72,75 +122,63 @@ class TaskQueue:
         
         if message:
             task_data["message"] = message
-        
-        # Store updated task
-        await self.redis.set(f"task:{task_id}", json.dumps(task_data))
-        
-        # Publish update
-        await self.redis.publish("task_updates", json.dumps({
+    
+    @staticmethod
+    def _status_event(task_id: str, status: str) -> str:
+        """Build a task_updated notification payload"""
+        return json.dumps({
             "event": "task_updated",
             "task_id": task_id,
             "status": status,
             "timestamp": datetime.now().isoformat()
-        }))
-        
-        return True
-    
-    async def store_task_result(self, task_id: str, result_data: Dict[str, Any]) -> bool:
-        """Store task result"""
-        result_data["task_id"] = task_id
-        result_data["timestamp"] = datetime.now().isoformat()
-        
-        # Store result
-        await self.redis.set(f"result:{task_id}", json.dumps(result_data))
-        
-        # Mark task as completed
-        await self.update_task_status(task_id, "completed", progress=100.0)
-        
-        # Publish update
-        await self.redis.publish("task_updates", json.dumps({
-            "event": "task_completed",
-            "task_id": task_id,
-            "timestamp": datetime.now().isoformat()
-        }))
-        
-        return True
+        })
     
     async def get_next_task(self, task_type: str, agent_id: str) -> Optional[Dict[str, Any]]:
         """Get the next task of a specific type"""
-        task_id = await self.redis.rpop(f"queue:{task_type}")
-        if not task_id:
+        # Pop the task ID and read its data in one round trip
+        popped = await self._pop_task(keys=[f"queue:{task_type}"])
+        if not popped:
+            return None
+        
+        task_id, task_data = popped
+        if not task_data:
             return None
         
         task_id = task_id.decode("utf-8")
-        task_data = await self.get_task(task_id)
+        task_data = json.loads(task_data)
+        
+        # Mark as assigned
+        self._apply_status(
+            task_data, "assigned",
+            agent_id=agent_id,
+            progress=0.0,
+            message=f"Assigned to agent {agent_id}"
+        )
         
-        if task_data:
-            # Mark as assigned
-            await self.update_task_status(
-                task_id=task_id,
-                status="assigned",
-                agent_id=agent_id,
-                progress=0.0,
-                message=f"Assigned to agent {agent_id}"
-            )
-            
-            return task_data
-            
-        return None
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.set(f"task:{task_id}", json.dumps(task_data))
+            pipe.publish("task_updates", self._status_event(task_id, "assigned"))
+            await pipe.execute()
+        
+        return task_data
     
     async def get_active_tasks(self) -> List[Dict[str, Any]]:
         """Get all active tasks"""
         active_tasks = []
         
-        # Get task IDs using pattern matching
-        task_keys = await self.redis.keys("task:*")
-        
-        for key in task_keys:
-            task_id = key.decode("utf-8").split(":", 1)[1]
-            task_data = await self.get_task(task_id)
-            
-            if task_data and task_data.get("status") in ["created", "assigned", "in_progress"]:
-                active_tasks.append(task_data)
-        
-        return active_tasks
\ No newline at end of file
+        # Walk task keys incrementally so Redis isn't blocked by a full KEYS scan
+        task_keys = [
+            key async for key in self.redis.scan_iter(match="task:*", count=SCAN_BATCH_SIZE)
+        ]
+        
+        # Fetch task data in batches
+        for i in range(0, len(task_keys), SCAN_BATCH_SIZE):
+            for task_data in await self.redis.mget(task_keys[i:i + SCAN_BATCH_SIZE]):
+                if not task_data:
+                    continue
+                
+                task = json.loads(task_data)
+                if task.get("status") in ["created", "assigned", "in_progress"]:
+                    active_tasks.append(task)
+        
+        return active_tasks
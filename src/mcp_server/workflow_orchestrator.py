@@ -2,9 +2,9 @@ import asyncio
 import json
 import uuid
 from datetime import datetime
-from typing import Dict, List, Any, Optional
-import redis.asyncio as redis
-from src.utils.config import Config
+from typing import Dict, List, Any, Optional, Set
+from src.mcp_server import redis_client
+from src.utils.config import get_config
 
 
 class WorkflowOrchestrator:
@@ -19,11 +19,28 @@ class WorkflowOrchestrator:
         """
         Initialize the workflow orchestrator with Redis connection.
         """
-        self.redis = redis.Redis(
-            host=Config.REDIS_HOST,
-            port=Config.REDIS_PORT,
-            db=Config.REDIS_DB
-        )
+        self.redis = redis_client.get_client()
+        self.pubsub = self.redis.pubsub()
+        self._waiters: Dict[str, asyncio.Future] = {}
+        self._dispatch_task: Optional[asyncio.Task] = None
+        # Running workflow monitors, kept so they aren't garbage collected
+        self._monitor_tasks: Set[asyncio.Task] = set()
+        self._init_lock = asyncio.Lock()
+
+    async def initialize(self):
+        """
+        Initialize the workflow orchestrator.
+
+        Subscribes to task updates and starts the shared dispatcher that
+        resolves per-task waiters. Safe to call more than once.
+        """
+        # Serialized so concurrent callers can't start two dispatchers
+        async with self._init_lock:
+            if self._dispatch_task is not None:
+                return
+
+            await self.pubsub.subscribe(task_updates=self._on_task_update)
+            self._dispatch_task = asyncio.create_task(self._dispatch_loop())
 
     async def create_workflow(self, workflow_type: str, target: str, scope: Dict[str, Any]) -> str:
         """
@@ -84,7 +101,16 @@ class WorkflowOrchestrator:
         workflow_data["status"] = status
         workflow_data["updated_at"] = datetime.now().isoformat()
 
-        await self.redis.set(f"workflow:{workflow_id}", json.dumps(workflow_data))
+        # Store the workflow and notify task update subscribers in one round trip
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.set(f"workflow:{workflow_id}", json.dumps(workflow_data))
+            pipe.publish("task_updates", json.dumps({
+                "event": "workflow_updated",
+                "workflow_id": workflow_id,
+                "status": status,
+                "timestamp": workflow_data["updated_at"]
+            }))
+            await pipe.execute()
         return True
 
     async def add_task_to_workflow(self, workflow_id: str, task_id: str, task_type: str) -> bool:
@@ -126,6 +152,8 @@ class WorkflowOrchestrator:
 
         Returns: Workflow ID
         """
+        await self.initialize()
+
         # Create workflow
         workflow_id = await self.create_workflow("recon_vuln", target, scope)
 
@@ -147,23 +175,37 @@ class WorkflowOrchestrator:
 
         await self.redis.set(f"task:{recon_task_id}", json.dumps(recon_task_data))
 
-        # Add to queue
-        await self.redis.lpush(f"queue:reconnaissance", recon_task_id)
+        # Register for completion before queueing so a fast task can't be missed
+        self._register_waiter(recon_task_id)
 
-        # Add to workflow
-        await self.add_task_to_workflow(workflow_id, recon_task_id, "reconnaissance")
+        try:
+            # Add to queue
+            await self.redis.lpush(f"queue:reconnaissance", recon_task_id)
 
-        # Update workflow status
-        await self.update_workflow_status(workflow_id, "in_progress")
+            # Add to workflow
+            await self.add_task_to_workflow(workflow_id, recon_task_id, "reconnaissance")
 
-        # Set up task completion handler (Redis subscription)
-        asyncio.create_task(self._monitor_recon_completion(workflow_id, recon_task_id, target, scope))
+            # Update workflow status
+            await self.update_workflow_status(workflow_id, "in_progress")
+        except Exception:
+            self._waiters.pop(recon_task_id, None)
+            raise
+
+        # Drive the rest of the workflow in the background
+        monitor = asyncio.create_task(self._monitor_recon_completion(workflow_id, recon_task_id, target, scope))
+        self._monitor_tasks.add(monitor)
+        monitor.add_done_callback(self._monitor_tasks.discard)
 
         return workflow_id
 
     async def _monitor_recon_completion(self, workflow_id: str, recon_task_id: str, target: str, scope: Dict[str, Any]):
         """
-        Monitor reconnaissance task completion and start vulnerability discovery.
+        Drive a recon_vuln workflow from reconnaissance through vulnerability discovery.
+
+        Waits for the reconnaissance task, queues the dependent vulnerability
+        discovery task, waits for that, and finalizes the workflow. Completion
+        events are delivered by the shared dispatcher, so no pubsub connection
+        is held per workflow.
 
         Args:
             workflow_id: ID of the workflow
@@ -171,103 +213,140 @@ class WorkflowOrchestrator:
             target: Target system
             scope: Dictionary containing scope information
         """
-        # Set up Redis pubsub
-        pubsub = self.redis.pubsub()
-        await pubsub.subscribe("task_updates")
+        timeout = get_config().WORKFLOW_TASK_TIMEOUT
+        vuln_task_id = None
 
-        while True:
+        try:
             try:
-                message = await pubsub.get_message(ignore_subscribe_messages=True)
-                if message and message["type"] == "message":
-                    data = json.loads(message["data"].decode("utf-8"))
-
-                    # Check if this is a completion message for our task
-                    if (data.get("event") == "task_completed" and
-                            data.get("task_id") == recon_task_id):
-                        print(f"Reconnaissance task {recon_task_id} completed, starting vulnerability discovery")
-
-                        # Get recon results
-                        recon_result_data = await self.redis.get(f"result:{recon_task_id}")
-                        if not recon_result_data:
-                            print(f"Error: No results found for recon task {recon_task_id}")
-                            await pubsub.unsubscribe("task_updates")
-                            return
-
-                        recon_result = json.loads(recon_result_data)
-
-                        # Create vulnerability discovery task
-                        vuln_task_data = {
-                            "type": "vulnerability_discovery",
-                            "target": target,
-                            "scope": scope,
-                            "description": f"Vulnerability discovery for {target}",
-                            "priority": 2,
-                            "workflow_id": workflow_id,
-                            "parent_task_id": recon_task_id
-                        }
-
-                        # Convert to JSON and store in Redis
-                        vuln_task_id = str(uuid.uuid4())
-                        vuln_task_data["id"] = vuln_task_id
-                        vuln_task_data["status"] = "created"
-                        vuln_task_data["created_at"] = datetime.now().isoformat()
-
-                        await self.redis.set(f"task:{vuln_task_id}", json.dumps(vuln_task_data))
-
-                        # Add to queue
-                        await self.redis.lpush(f"queue:vulnerability_discovery", vuln_task_id)
-
-                        # Add to workflow
-                        await self.add_task_to_workflow(workflow_id, vuln_task_id, "vulnerability_discovery")
-
-                        # Set up task completion handler
-                        asyncio.create_task(self._monitor_vuln_completion(workflow_id, vuln_task_id))
-
-                        # Unsubscribe since we've handled this task
-                        await pubsub.unsubscribe("task_updates")
-                        return
-
-                # Small delay to prevent CPU overuse
-                await asyncio.sleep(0.01)
-            except Exception as e:
-                print(f"Error monitoring recon completion: {e}")
-                await asyncio.sleep(1)
+                await asyncio.wait_for(self._wait_for_task(recon_task_id), timeout=timeout)
+            except asyncio.TimeoutError:
+                print(f"Timed out waiting for recon task {recon_task_id} in workflow {workflow_id}")
+                await self.update_workflow_status(workflow_id, "failed")
+                return
+
+            print(f"Reconnaissance task {recon_task_id} completed, starting vulnerability discovery")
+
+            # Get recon results
+            recon_result_data = await self.redis.get(f"result:{recon_task_id}")
+            if not recon_result_data:
+                print(f"Error: No results found for recon task {recon_task_id}")
+                await self.update_workflow_status(workflow_id, "failed")
+                return
+
+            # Create vulnerability discovery task
+            vuln_task_data = {
+                "type": "vulnerability_discovery",
+                "target": target,
+                "scope": scope,
+                "description": f"Vulnerability discovery for {target}",
+                "priority": 2,
+                "workflow_id": workflow_id,
+                "parent_task_id": recon_task_id
+            }
+
+            # Convert to JSON and store in Redis
+            vuln_task_id = str(uuid.uuid4())
+            vuln_task_data["id"] = vuln_task_id
+            vuln_task_data["status"] = "created"
+            vuln_task_data["created_at"] = datetime.now().isoformat()
+
+            await self.redis.set(f"task:{vuln_task_id}", json.dumps(vuln_task_data))
+
+            # Register for completion before queueing so a fast task can't be missed
+            self._register_waiter(vuln_task_id)
+
+            # Add to queue
+            await self.redis.lpush(f"queue:vulnerability_discovery", vuln_task_id)
+
+            # Add to workflow
+            await self.add_task_to_workflow(workflow_id, vuln_task_id, "vulnerability_discovery")
 
-    async def _monitor_vuln_completion(self, workflow_id: str, vuln_task_id: str):
+            try:
+                await asyncio.wait_for(self._wait_for_task(vuln_task_id), timeout=timeout)
+            except asyncio.TimeoutError:
+                print(f"Timed out waiting for vulnerability task {vuln_task_id} in workflow {workflow_id}")
+                await self.update_workflow_status(workflow_id, "failed")
+                return
+
+            print(f"Vulnerability discovery task {vuln_task_id} completed, workflow {workflow_id} complete")
+
+            # Update workflow status
+            await self.update_workflow_status(workflow_id, "completed")
+        except Exception as e:
+            print(f"Error monitoring workflow {workflow_id}: {e}")
+            try:
+                await self.update_workflow_status(workflow_id, "failed")
+            except Exception as status_error:
+                print(f"Error marking workflow {workflow_id} as failed: {status_error}")
+        finally:
+            # Drop waiters whose wait was never reached
+            self._waiters.pop(recon_task_id, None)
+            if vuln_task_id is not None:
+                self._waiters.pop(vuln_task_id, None)
+
+    def _register_waiter(self, task_id: str) -> asyncio.Future:
         """
-        Monitor vulnerability discovery task completion and finalize workflow.
+        Register interest in a task's completion.
+
+        Must be called before the task is queued; the dispatcher resolves the
+        returned future as soon as the task_completed event arrives.
 
         Args:
-            workflow_id: ID of the workflow
-            vuln_task_id: ID of the vulnerability discovery task
+            task_id: ID of the task to wait for
+
+        Returns: Future resolved with the task_completed event payload
         """
-        # Set up Redis pubsub
-        pubsub = self.redis.pubsub()
-        await pubsub.subscribe("task_updates")
+        future = asyncio.get_running_loop().create_future()
+        self._waiters[task_id] = future
+        return future
 
-        while True:
-            try:
-                message = await pubsub.get_message(ignore_subscribe_messages=True)
-                if message and message["type"] == "message":
-                    data = json.loads(message["data"].decode("utf-8"))
+    async def _wait_for_task(self, task_id: str) -> Dict[str, Any]:
+        """
+        Wait for a task completion event from the shared dispatcher.
+
+        Uses the waiter registered with _register_waiter, or registers one
+        if the task was queued without it.
+
+        Args:
+            task_id: ID of the task to wait for
 
-                    # Check if this is a completion message for our task
-                    if (data.get("event") == "task_completed" and
-                            data.get("task_id") == vuln_task_id):
-                        print(f"Vulnerability discovery task {vuln_task_id} completed, workflow {workflow_id} complete")
+        Returns: The task_completed event payload
+        """
+        future = self._waiters.get(task_id) or self._register_waiter(task_id)
 
-                        # Update workflow status
-                        await self.update_workflow_status(workflow_id, "completed")
+        try:
+            return await future
+        finally:
+            self._waiters.pop(task_id, None)
 
-                        # Unsubscribe since we've handled this task
-                        await pubsub.unsubscribe("task_updates")
-                        return
+    async def _dispatch_loop(self):
+        """
+        Route task completion events to registered waiters.
 
-                # Small delay to prevent CPU overuse
-                await asyncio.sleep(0.01)
+        A single pubsub subscription is shared by every workflow running in
+        this process; each message is handed to _on_task_update.
+        """
+        while True:
+            try:
+                await self.pubsub.run()
             except Exception as e:
-                print(f"Error monitoring vuln completion: {e}")
-                await asyncio.sleep(1)
+                print(f"Error in workflow dispatcher: {e}")
+                await asyncio.sleep(1)  # Delay before retry
+
+    async def _on_task_update(self, message: Dict[str, Any]):
+        """
+        Resolve the waiter for a completed task, if any.
+
+        Args:
+            message: Pubsub data message from the task_updates channel
+        """
+        data = json.loads(message["data"])
+        if data.get("event") != "task_completed":
+            return
+
+        future = self._waiters.get(data.get("task_id"))
+        if future is not None and not future.done():
+            future.set_result(data)
 
     async def get_workflow_results(self, workflow_id: str) -> Dict[str, Any]:
         """
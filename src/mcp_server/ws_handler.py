@@ -4,18 +4,13 @@ import asyncio
 import json
 from fastapi import WebSocket, WebSocketDisconnect
 from typing import Dict, List, Any
-import redis.asyncio as redis
-from src.utils.config import Config
+from src.mcp_server import redis_client
 
 
 class ConnectionManager:
     def __init__(self):
         self.active_connections: List[WebSocket] = []
-        self.redis = redis.Redis(
-            host=Config.REDIS_HOST,
-            port=Config.REDIS_PORT,
-            db=Config.REDIS_DB
-        )
+        self.redis = redis_client.get_client()
         self.pubsub = self.redis.pubsub()
     
     async def connect(self, websocket: WebSocket):
@@ -23,32 +18,42 @@ class ConnectionManager:
         self.active_connections.append(websocket)
     
     def disconnect(self, websocket: WebSocket):
-        self.active_connections.remove(websocket)
+        if websocket in self.active_connections:
+            self.active_connections.remove(websocket)
     
     async def send_personal_message(self, message: str, websocket: WebSocket):
         await websocket.send_text(message)
     
-    async def broadcast(self, message: str):
-        for connection in self.active_connections:
-            await connection.send_text(message)
+    async def broadcast_bytes(self, data: bytes):
+        # Redis already hands us the encoded payload, so send it as-is
+        # instead of having every client send re-encode the same text.
+        # Send to all clients concurrently so one slow client can't stall the rest
+        connections = list(self.active_connections)
+        results = await asyncio.gather(
+            *(connection.send_bytes(data) for connection in connections),
+            return_exceptions=True
+        )
+
+        # Drop clients whose send failed
+        for connection, result in zip(connections, results):
+            if isinstance(result, Exception):
+                self.disconnect(connection)
     
     async def start_redis_listener(self):
-        await self.pubsub.subscribe("task_updates")
+        await self.pubsub.subscribe(task_updates=self._on_task_update)
         
         # Create background task to listen for Redis messages
         asyncio.create_task(self._redis_listener())
     
+    async def _on_task_update(self, message: Dict[str, Any]):
+        # Broadcast the raw payload to all connected clients
+        await self.broadcast_bytes(message["data"])
+    
     async def _redis_listener(self):
         while True:
             try:
-                message = await self.pubsub.get_message(ignore_subscribe_messages=True)
-                if message and message["type"] == "message":
-                    data = message["data"].decode("utf-8")
-                    # Broadcast to all connected clients
-                    await self.broadcast(data)
-                
-                # Small delay to prevent CPU overuse
-                await asyncio.sleep(0.01)
+                # Blocks until a message arrives and hands it to _on_task_update
+                await self.pubsub.run()
             except Exception as e:
                 print(f"Error in Redis listener: {e}")
                 await asyncio.sleep(1)  # Delay before retry
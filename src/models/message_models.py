@@ -1,7 +1,47 @@
-from pydantic import BaseModel, Field
-from typing import Dict, List, Optional, Any
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+from typing import Annotated, Dict, List, Literal, Optional, Any, Union
+from typing_extensions import NotRequired, TypedDict
 from datetime import datetime
-from uuid import UUID, uuid4
+from uuid import UUID
+from src.models.factories import fast_uuid4, cached_now
+
+
+# Message content payloads. TypedDicts rather than nested models so the
+# content stays a plain dict. pydantic needs typing_extensions' TypedDict
+# on Python < 3.12.
+
+class TaskAssignmentContent(TypedDict):
+    task_id: UUID
+    task_type: str
+    target: str
+    scope: Dict[str, Any]
+    description: NotRequired[str]
+
+
+class TaskStatusUpdateContent(TypedDict):
+    task_id: UUID
+    status: str
+    progress: float
+    message: NotRequired[str]
+
+
+class TaskResultContent(TypedDict):
+    task_id: UUID
+    status: str
+    result: Dict[str, Any]
+    summary: str
+
+
+class KnowledgeQueryContent(TypedDict):
+    query: str
+    collection: str
+    n_results: NotRequired[int]
+
+
+class KnowledgeResponseContent(TypedDict):
+    query: str
+    collection: NotRequired[str]
+    results: List[Dict[str, Any]]
 
 
 class Message(BaseModel):
@@ -12,32 +52,49 @@ class Message(BaseModel):
     in the multi-agent system.
     """
 
-    message_id: UUID = Field(default_factory=uuid4, description="Unique message ID")
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
+    message_id: UUID = Field(default_factory=fast_uuid4, description="Unique message ID")
     sender_id: str = Field(..., description="Sender agent ID")
     recipient_id: Optional[str] = Field(default=None, description="Recipient agent ID")
     message_type: str = Field(..., description="Type of message")
     content: Dict[str, Any] = Field(..., description="Message content")
-    timestamp: datetime = Field(default_factory=datetime.now, description="Message timestamp")
+    timestamp: datetime = Field(default_factory=cached_now, description="Message timestamp")
     reply_to: Optional[UUID] = Field(default=None, description="ID of message this is replying to")
     metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
 
+    @classmethod
+    def build_trusted(cls, **data: Any) -> "Message":
+        """
+        Build a message from data produced inside the framework, skipping validation.
+
+        Defaults such as the message ID, timestamp and message type are still
+        filled in. Never use this for payloads received from outside the process.
+
+        Args:
+            **data: Message fields
+
+        Returns: Message instance
+        """
+        return cls.model_construct(**data)
+
 
 class TaskAssignmentMessage(Message):
     """
     Message for assigning a task to an agent.
     """
 
-    message_type: str = "task_assignment"
-    content: Dict[str, Any] = Field(
+    message_type: Literal["task_assignment"] = "task_assignment"
+    content: TaskAssignmentContent = Field(
         ...,
         description="Task assignment details",
-        example={
+        json_schema_extra={"example": {
             "task_id": "123e4567-e89b-12d3-a456-426614174000",
             "task_type": "reconnaissance",
             "target": "192.168.1.1",
             "scope": {"ip_range": "192.168.1.0/24"},
             "description": "Initial reconnaissance scan"
-        }
+        }}
     )
 
 
@@ -46,16 +103,16 @@ class TaskStatusUpdateMessage(Message):
     Message for updating task status.
     """
 
-    message_type: str = "task_status_update"
-    content: Dict[str, Any] = Field(
+    message_type: Literal["task_status_update"] = "task_status_update"
+    content: TaskStatusUpdateContent = Field(
         ...,
         description="Task status update details",
-        example={
+        json_schema_extra={"example": {
             "task_id": "123e4567-e89b-12d3-a456-426614174000",
             "status": "in_progress",
             "progress": 45.0,
             "message": "Scanning ports 1-1000"
-        }
+        }}
     )
 
 
@@ -64,16 +121,16 @@ class TaskResultMessage(Message):
     Message for reporting task results.
     """
 
-    message_type: str = "task_result"
-    content: Dict[str, Any] = Field(
+    message_type: Literal["task_result"] = "task_result"
+    content: TaskResultContent = Field(
         ...,
         description="Task result details",
-        example={
+        json_schema_extra={"example": {
             "task_id": "123e4567-e89b-12d3-a456-426614174000",
             "status": "success",
             "result": {"open_ports": [22, 80, 443]},
             "summary": "Found 3 open ports"
-        }
+        }}
     )
 
 
@@ -82,15 +139,15 @@ class KnowledgeQueryMessage(Message):
     Message for querying the knowledge base.
     """
 
-    message_type: str = "knowledge_query"
-    content: Dict[str, Any] = Field(
+    message_type: Literal["knowledge_query"] = "knowledge_query"
+    content: KnowledgeQueryContent = Field(
         ...,
         description="Knowledge query details",
-        example={
+        json_schema_extra={"example": {
             "query": "vulnerabilities for Apache 2.4.41",
             "collection": "vulnerabilities",
             "n_results": 5
-        }
+        }}
     )
 
 
@@ -99,12 +156,29 @@ class KnowledgeResponseMessage(Message):
     Message with knowledge base query results.
     """
 
-    message_type: str = "knowledge_response"
-    content: Dict[str, Any] = Field(
+    message_type: Literal["knowledge_response"] = "knowledge_response"
+    content: KnowledgeResponseContent = Field(
         ...,
         description="Knowledge response details",
-        example={
+        json_schema_extra={"example": {
             "query": "vulnerabilities for Apache 2.4.41",
             "results": [{"id": "vuln1", "name": "Apache Range Header DoS"}]
-        }
-    )
\ No newline at end of file
+        }}
+    )
+
+
+# Any message carried on the bus, discriminated by its message_type
+BusMessage = Annotated[
+    Union[
+        TaskAssignmentMessage,
+        TaskStatusUpdateMessage,
+        TaskResultMessage,
+        KnowledgeQueryMessage,
+        KnowledgeResponseMessage,
+    ],
+    Field(discriminator="message_type"),
+]
+
+# Validates raw bus payloads into the matching message model; used by
+# MessageBus to decode inbound messages. Built once at import time.
+BusAdapter = TypeAdapter(BusMessage)
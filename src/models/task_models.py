@@ -1,15 +1,20 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 from typing import Dict, List, Optional, Any, Literal
 from datetime import datetime
-from uuid import UUID, uuid4
+from uuid import UUID
+from src.models.factories import cached_now
 
 class TaskScope(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     ip_range: str = Field(..., description="IP range in CIDR notation")
-    excluded_ips: List[str] = Field(default=[], description="IPs to exclude from scope")
-    excluded_ports: List[int] = Field(default=[], description="Ports to exclude from scope")
+    excluded_ips: List[str] = Field(default_factory=list, description="IPs to exclude from scope")
+    excluded_ports: List[int] = Field(default_factory=list, description="Ports to exclude from scope")
     max_depth: int = Field(default=2, description="Maximum depth for discovery")
 
 class TaskCreate(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     type: Literal["reconnaissance", "vulnerability_discovery", "exploitation", "reporting"] = Field(
         ..., description="Type of task to perform"
     )
@@ -20,11 +25,15 @@ class TaskCreate(BaseModel):
     priority: int = Field(default=1, description="Task priority (1-5)")
 
 class TaskResponse(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     task_id: UUID = Field(..., description="UUID of the created task")
     status: str = Field(..., description="Status of the task")
-    created_at: datetime = Field(default_factory=datetime.now, description="Creation timestamp")
+    created_at: datetime = Field(default_factory=cached_now, description="Creation timestamp")
 
 class TaskStatus(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     task_id: UUID = Field(..., description="UUID of the task")
     status: Literal["created", "assigned", "in_progress", "completed", "failed"] = Field(
         ..., description="Status of the task"
@@ -32,11 +41,17 @@ class TaskStatus(BaseModel):
     agent_id: Optional[str] = Field(default=None, description="ID of the agent assigned to the task")
     progress: float = Field(default=0.0, description="Progress of the task (0-100)")
     message: Optional[str] = Field(default=None, description="Status message")
-    updated_at: datetime = Field(default_factory=datetime.now, description="Last update timestamp")
+    updated_at: datetime = Field(default_factory=cached_now, description="Last update timestamp")
 
 class TaskResult(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     task_id: UUID = Field(..., description="UUID of the task")
     status: Literal["success", "partial", "failed"] = Field(..., description="Result status")
     data: Dict[str, Any] = Field(..., description="Result data")
     summary: str = Field(..., description="Human-readable summary of the result")
-    created_at: datetime = Field(default_factory=datetime.now, description="Creation timestamp")
\ No newline at end of file
+    created_at: datetime = Field(default_factory=cached_now, description="Creation timestamp")
+
+# Validator for task status payloads, used by the status update endpoint.
+# Built once at import time so the schema isn't rebuilt per request.
+TaskStatusAdapter = TypeAdapter(TaskStatus)
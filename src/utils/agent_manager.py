@@ -4,9 +4,6 @@ import argparse
 import sys
 import os
 import signal
-from src.agents.reconnaissance_agent import ReconnaissanceAgent
-from src.agents.vulnerability_discovery_agent import VulnerabilityDiscoveryAgent
-from src.agents.knowledge_base_agent import KnowledgeBaseAgent
 
 
 class AgentManager:
@@ -27,6 +24,9 @@ class AgentManager:
         """
         Run a reconnaissance agent.
         """
+        # Imported here so only the agents actually run are loaded
+        from src.agents.reconnaissance_agent import ReconnaissanceAgent
+
         agent = ReconnaissanceAgent()
         self.agents.append(agent)
         await agent.start()
@@ -35,6 +35,9 @@ class AgentManager:
         """
         Run a vulnerability discovery agent.
         """
+        # Imported here so only the agents actually run are loaded
+        from src.agents.vulnerability_discovery_agent import VulnerabilityDiscoveryAgent
+
         agent = VulnerabilityDiscoveryAgent()
         self.agents.append(agent)
         await agent.start()
@@ -43,6 +46,9 @@ class AgentManager:
         """
         Run a knowledge base agent.
         """
+        # Imported here so only the agents actually run are loaded
+        from src.agents.knowledge_base_agent import KnowledgeBaseAgent
+
         agent = KnowledgeBaseAgent()
         self.agents.append(agent)
         await agent.start()
@@ -56,39 +62,37 @@ class AgentManager:
 
         self.stop_event.set()
 
-    async def run_workflow_agents(self):
+    async def run_agents(self, *runners):
         """
-        Run all agents needed for a complete workflow.
-        """
-        # Start all agents
-        kb_task = asyncio.create_task(self.run_kb_agent())
-        recon_task = asyncio.create_task(self.run_recon_agent())
-        vuln_task = asyncio.create_task(self.run_vuln_agent())
+        Run the given agent runners until a stop is requested.
+
+        If any agent fails, the others are cancelled and the error is raised.
 
-        # Wait for stop event
-        await self.stop_event.wait()
+        Args:
+            runners: Agent runner coroutine functions, e.g. self.run_recon_agent
+        """
+        async with asyncio.TaskGroup() as tg:
+            for runner in runners:
+                tg.create_task(runner())
 
-        # Cancel all tasks
-        kb_task.cancel()
-        recon_task.cancel()
-        vuln_task.cancel()
+            # Wait for stop event, then let the agents finish their loops
+            await self.stop_event.wait()
+            await self.stop_all_agents()
 
-        try:
-            await asyncio.gather(kb_task, recon_task, vuln_task)
-        except asyncio.CancelledError:
-            pass
+    async def run_workflow_agents(self):
+        """
+        Run all agents needed for a complete workflow.
+        """
+        await self.run_agents(self.run_kb_agent, self.run_recon_agent, self.run_vuln_agent)
 
     def handle_signals(self):
         """
         Set up signal handlers for graceful shutdown.
         """
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
 
         for sig in (signal.SIGINT, signal.SIGTERM):
-            loop.add_signal_handler(
-                sig,
-                lambda: asyncio.create_task(self.stop_all_agents())
-            )
+            loop.add_signal_handler(sig, self.stop_event.set)
 
 
 async def main():
@@ -114,31 +118,21 @@ async def main():
         print("Starting all workflow agents...")
         await manager.run_workflow_agents()
     else:
-        tasks = []
+        runners = []
 
         if args.kb:
             print("Starting knowledge base agent...")
-            tasks.append(asyncio.create_task(manager.run_kb_agent()))
+            runners.append(manager.run_kb_agent)
 
         if args.recon:
             print("Starting reconnaissance agent...")
-            tasks.append(asyncio.create_task(manager.run_recon_agent()))
+            runners.append(manager.run_recon_agent)
 
         if args.vuln:
             print("Starting vulnerability discovery agent...")
-            tasks.append(asyncio.create_task(manager.run_vuln_agent()))
-
-        # Set up signal handling for graceful shutdown
-        done, pending = await asyncio.wait(
-            tasks,
-            return_when=asyncio.FIRST_COMPLETED
-        )
-
-        # Cancel remaining tasks
-        for task in pending:
-            task.cancel()
+            runners.append(manager.run_vuln_agent)
 
-        await manager.stop_all_agents()
+        await manager.run_agents(*runners)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,122 @@
+import asyncio
+from typing import Any, Dict, Optional, Union
+from src.mcp_server.message_bus import MessageBus
+from src.models.message_models import Message
+
+
+class MessageBatcher:
+    """
+    Coalesces outbound messages into batched message bus writes.
+
+    Messages submitted within a short window are sent together in one
+    Redis pipeline instead of one round trip each.
+    """
+
+    def __init__(self, message_bus: MessageBus, max_batch: int = 10, max_delay: float = 0.005):
+        """
+        Initialize the batcher.
+
+        Args:
+            message_bus: Message bus used to send the batches
+            max_batch: Maximum number of messages sent in one batch
+            max_delay: Seconds to wait for more messages after the first one arrives
+        """
+        self.message_bus = message_bus
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        """
+        Start the background task that sends batches.
+        """
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def submit(self, message: Union[Dict[str, Any], Message]) -> str:
+        """
+        Send a message with the next batch.
+
+        Waits until the batch containing the message has been written, so
+        send errors are raised to the caller. If the batcher is not running,
+        the message is written immediately instead.
+
+        Args:
+            message: Message model or dictionary containing the message data
+
+        Returns: Message ID of the sent message
+        """
+        message = self.message_bus.prepare_message(message)
+
+        # Nothing would drain the queue, so send straight through
+        if self._task is None:
+            await self.message_bus.send_messages([message])
+            return message["message_id"]
+
+        sent = asyncio.get_running_loop().create_future()
+        self.queue.put_nowait((message, sent))
+        await sent
+        return message["message_id"]
+
+    async def stop(self, timeout: float = 5.0):
+        """
+        Send any queued messages and stop the background task.
+
+        Messages still queued after the timeout are dropped and their
+        senders get an error. Messages submitted afterwards are sent directly.
+
+        Args:
+            timeout: Seconds to wait for queued messages to be sent
+        """
+        if self._task is None:
+            return
+
+        try:
+            await asyncio.wait_for(self.queue.join(), timeout=timeout)
+        except asyncio.TimeoutError:
+            print(f"Timed out sending queued messages; dropping {self.queue.qsize()}")
+
+        task, self._task = self._task, None
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+        while not self.queue.empty():
+            _, sent = self.queue.get_nowait()
+            self.queue.task_done()
+            if not sent.done():
+                sent.set_exception(RuntimeError("Message batcher stopped before the message was sent"))
+
+    async def _run(self):
+        """
+        Collect queued messages into batches and send them.
+        """
+        while True:
+            batch = [await self.queue.get()]
+
+            # Give other producers a moment to add to this batch
+            if self.queue.qsize() < self.max_batch - 1:
+                await asyncio.sleep(self.max_delay)
+
+            while len(batch) < self.max_batch and not self.queue.empty():
+                batch.append(self.queue.get_nowait())
+
+            try:
+                await self.message_bus.send_messages([message for message, _ in batch])
+            except Exception as e:
+                for _, sent in batch:
+                    if not sent.done():
+                        sent.set_exception(e)
+            else:
+                for _, sent in batch:
+                    if not sent.done():
+                        sent.set_result(None)
+            finally:
+                for _, sent in batch:
+                    # Only left unresolved if the send was cancelled by stop()
+                    if not sent.done():
+                        sent.set_exception(RuntimeError("Message batcher stopped before the message was sent"))
+                    self.queue.task_done()
@@ -1,18 +1,48 @@
-import os
+import asyncio
+import functools
 import anthropic
-from dotenv import load_dotenv
-from typing import List, Dict, Any, Optional
+from typing import AsyncIterator, List, Dict, Any, Optional, Tuple
+from src.utils.config import get_config
 
-# Load environment variables
-load_dotenv()
+@functools.lru_cache(maxsize=1)
+def _get_async_client(api_key: str) -> anthropic.AsyncAnthropic:
+    """Shared async client so every ClaudeClient reuses one HTTP connection pool"""
+    return anthropic.AsyncAnthropic(api_key=api_key, max_retries=2, timeout=60.0)
+
+@functools.lru_cache(maxsize=1)
+def _get_llm_semaphore() -> asyncio.Semaphore:
+    """Process-wide cap on concurrent Claude API calls, built on first use"""
+    return asyncio.Semaphore(get_config().LLM_CONCURRENCY)
+
+# Few-shot message prefixes keyed by id() of the examples list. Each entry
+# keeps a reference to the list so its id can't be reused while cached.
+_EXAMPLE_CACHE_SIZE = 32
+_example_cache: Dict[int, Tuple[List[Dict[str, str]], List[Dict[str, str]]]] = {}
+
+def _example_messages(examples: List[Dict[str, str]]) -> List[Dict[str, str]]:
+    """Build (or reuse) the user/assistant message pairs for a list of few-shot examples"""
+    cached = _example_cache.get(id(examples))
+    if cached is not None and cached[0] is examples:
+        return cached[1]
+    
+    messages = []
+    for example in examples:
+        messages.append({"role": "user", "content": example["user"]})
+        messages.append({"role": "assistant", "content": example["assistant"]})
+    
+    if len(_example_cache) >= _EXAMPLE_CACHE_SIZE:
+        _example_cache.pop(next(iter(_example_cache)))
+    _example_cache[id(examples)] = (examples, messages)
+    
+    return messages
 
 class ClaudeClient:
     def __init__(self):
-        api_key = os.getenv("ANTHROPIC_API_KEY")
+        api_key = get_config().ANTHROPIC_API_KEY
         if not api_key:
             raise ValueError("ANTHROPIC_API_KEY environment variable is not set")
         
-        self.client = anthropic.Anthropic(api_key=api_key)
+        self.client = _get_async_client(api_key)
         self.default_model = "claude-3-sonnet-20240229"
     
     async def generate_response(
@@ -35,20 +65,59 @@ class ClaudeClient:
             Claude's response text
         """
         try:
-            response = await self.client.messages.create(
-                model=model or self.default_model,
-                max_tokens=max_tokens,
-                system=system_prompt,
-                messages=[
-                    {"role": "user", "content": user_message}
-                ]
-            )
+            async with _get_llm_semaphore():
+                response = await self.client.messages.create(
+                    model=model or self.default_model,
+                    max_tokens=max_tokens,
+                    system=system_prompt,
+                    messages=[
+                        {"role": "user", "content": user_message}
+                    ]
+                )
             
             return response.content[0].text
         except Exception as e:
             print(f"Error generating response from Claude: {e}")
             raise
     
+    async def stream_response(
+        self,
+        system_prompt: str,
+        user_message: str,
+        model: Optional[str] = None,
+        max_tokens: int = 4000
+    ) -> AsyncIterator[str]:
+        """
+        Stream a response from Claude as it is generated.
+        
+        Callers can act on the text as it arrives instead of waiting for the
+        full response; collect it with "".join([c async for c in ...]).
+        
+        Args:
+            system_prompt: The system prompt to guide Claude's behavior
+            user_message: The user's message
+            model: The Claude model to use, defaults to claude-3-sonnet
+            max_tokens: Maximum tokens in the response
+            
+        Yields:
+            Chunks of Claude's response text
+        """
+        try:
+            async with _get_llm_semaphore():
+                async with self.client.messages.stream(
+                    model=model or self.default_model,
+                    max_tokens=max_tokens,
+                    system=system_prompt,
+                    messages=[
+                        {"role": "user", "content": user_message}
+                    ]
+                ) as stream:
+                    async for text in stream.text_stream:
+                        yield text
+        except Exception as e:
+            print(f"Error streaming response from Claude: {e}")
+            raise
+    
     async def analyze_with_few_shot(
         self,
         system_prompt: str,
@@ -62,7 +131,8 @@ class ClaudeClient:
         
         Args:
             system_prompt: The system prompt
-            examples: List of example pairs with 'user' and 'assistant' keys
+            examples: List of example pairs with 'user' and 'assistant' keys;
+                must not be modified after the first call
             query: The query to analyze
             model: The Claude model to use
             max_tokens: Maximum tokens in the response
@@ -70,23 +140,18 @@ class ClaudeClient:
         Returns:
             Claude's response
         """
-        messages = []
-        
-        # Add examples as context
-        for example in examples:
-            messages.append({"role": "user", "content": example["user"]})
-            messages.append({"role": "assistant", "content": example["assistant"]})
-        
-        # Add the actual query
-        messages.append({"role": "user", "content": query})
+        # Add examples as context, followed by the actual query. Example
+        # lists are treated as immutable so their messages can be cached.
+        messages = [*_example_messages(examples), {"role": "user", "content": query}]
         
         try:
-            response = await self.client.messages.create(
-                model=model or self.default_model,
-                max_tokens=max_tokens,
-                system=system_prompt,
-                messages=messages
-            )
+            async with _get_llm_semaphore():
+                response = await self.client.messages.create(
+                    model=model or self.default_model,
+                    max_tokens=max_tokens,
+                    system=system_prompt,
+                    messages=messages
+                )
             
             return response.content[0].text
         except Exception as e:
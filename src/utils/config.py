@@ -1,33 +1,70 @@
+import functools
 import os
+from dataclasses import dataclass
+from typing import Optional
 from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
-
-# Add ChromaDB settings
-CHROMA_HOST = os.getenv("CHROMA_HOST", "chromadb")
-CHROMA_PORT = int(os.getenv("CHROMA_PORT", "8000"))
-
+@dataclass(frozen=True, slots=True)
 class Config:
     # API Keys
-    ANTHROPIC_API_KEY = os.getenv("ANTHROPIC_API_KEY")
+    ANTHROPIC_API_KEY: Optional[str]
+    
+    # Maximum concurrent Claude API calls per process
+    LLM_CONCURRENCY: int
     
     # Server settings
-    MCP_SERVER_PORT = int(os.getenv("MCP_SERVER_PORT", "8000"))
-    ENVIRONMENT = os.getenv("ENVIRONMENT", "development")
+    MCP_SERVER_PORT: int
+    ENVIRONMENT: str
     
     # Security
-    AUTH_TOKEN = os.getenv("AUTH_TOKEN", "dev_token")
+    AUTH_TOKEN: str
     
     # Redis
-    REDIS_HOST = os.getenv("REDIS_HOST", "redis")
-    REDIS_PORT = int(os.getenv("REDIS_PORT", "6379"))
-    REDIS_DB = int(os.getenv("REDIS_DB", "0"))
+    REDIS_HOST: str
+    REDIS_PORT: int
+    REDIS_DB: int
+    REDIS_MAX_CONNECTIONS: int
+    # Seconds to wait for a free pooled connection before raising
+    REDIS_POOL_TIMEOUT: int
+    
+    # ChromaDB
+    CHROMA_HOST: str
+    CHROMA_PORT: int
+    
+    # Workflows
+    WORKFLOW_TASK_TIMEOUT: int
+    
+    def is_development(self):
+        return self.ENVIRONMENT.lower() == "development"
+    
+    def is_production(self):
+        return self.ENVIRONMENT.lower() == "production"
+
+@functools.cache
+def get_config() -> Config:
+    """
+    Load environment variables and build the configuration.
+    
+    The .env file is read on the first call only; later calls return the
+    same Config instance.
     
-    @classmethod
-    def is_development(cls):
-        return cls.ENVIRONMENT.lower() == "development"
+    Returns: Process-wide Config instance
+    """
+    # Load environment variables
+    load_dotenv()
     
-    @classmethod
-    def is_production(cls):
-        return cls.ENVIRONMENT.lower() == "production"
\ No newline at end of file
+    return Config(
+        ANTHROPIC_API_KEY=os.getenv("ANTHROPIC_API_KEY"),
+        LLM_CONCURRENCY=int(os.getenv("LLM_CONCURRENCY", "4")),
+        MCP_SERVER_PORT=int(os.getenv("MCP_SERVER_PORT", "8000")),
+        ENVIRONMENT=os.getenv("ENVIRONMENT", "development"),
+        AUTH_TOKEN=os.getenv("AUTH_TOKEN", "dev_token"),
+        REDIS_HOST=os.getenv("REDIS_HOST", "redis"),
+        REDIS_PORT=int(os.getenv("REDIS_PORT", "6379")),
+        REDIS_DB=int(os.getenv("REDIS_DB", "0")),
+        REDIS_MAX_CONNECTIONS=int(os.getenv("REDIS_MAX_CONNECTIONS", "64")),
+        REDIS_POOL_TIMEOUT=int(os.getenv("REDIS_POOL_TIMEOUT", "20")),
+        CHROMA_HOST=os.getenv("CHROMA_HOST", "chromadb"),
+        CHROMA_PORT=int(os.getenv("CHROMA_PORT", "8000")),
+        WORKFLOW_TASK_TIMEOUT=int(os.getenv("WORKFLOW_TASK_TIMEOUT", "3600")),
+    )
\ No newline at end of file
@@ -1,11 +1,11 @@
 #!/usr/bin/env python3
-import requests
+import asyncio
+import aiohttp
 import json
 import argparse
-import time
 import sys
 
-def create_task(host='localhost', port=8000, token='dev_token'):
+async def create_task(host='localhost', port=8000, token='dev_token'):
     """Create a test task and simulate progress updates"""
     base_url = f"http://{host}:{port}"
     headers = {
@@ -27,50 +27,45 @@ def create_task(host='localhost', port=8000, token='dev_token'):
         "priority": 2
     }
     
+    # One session for the create call and every status update, so the
+    # connection is reused instead of reopened per request
+    connector = aiohttp.TCPConnector(limit=0, keepalive_timeout=30)
     try:
-        response = requests.post(
-            f"{base_url}/api/task/create",
-            headers=headers,
-            json=task_data
-        )
-        
-        if response.status_code == 200:
-            result = response.json()
+        async with aiohttp.ClientSession(headers=headers, connector=connector) as session:
+            async with session.post(f"{base_url}/api/task/create", json=task_data) as response:
+                if response.status != 200:
+                    print(f"Failed to create task: {response.status}")
+                    print(await response.text())
+                    return None
+                
+                result = await response.json()
+            
             task_id = result["task_id"]
             print(f"Created task with ID: {task_id}")
             
             # Simulate task status updates
+            status_url = f"{base_url}/api/task/{task_id}/status"
             for progress in [10, 25, 50, 75, 100]:
-                time.sleep(2)  # Wait 2 seconds between updates
+                await asyncio.sleep(2)  # Wait 2 seconds between updates
                 
                 status = "completed" if progress == 100 else "in_progress"
                 message = "Task completed successfully" if progress == 100 else f"Processing task: {progress}% complete"
                 
-                status_url = f"{base_url}/api/task/{task_id}/status"
                 status_data = {
                     "status": status,
                     "progress": float(progress),
                     "message": message
                 }
                 
-                status_response = requests.put(
-                    status_url,
-                    headers=headers,
-                    json=status_data
-                )
-                
-                if status_response.status_code == 200:
-                    print(f"Updated task status: {progress}% complete")
-                else:
-                    print(f"Failed to update task status: {status_response.status_code}")
-                    print(status_response.text)
+                async with session.put(status_url, json=status_data) as status_response:
+                    if status_response.status == 200:
+                        print(f"Updated task status: {progress}% complete")
+                    else:
+                        print(f"Failed to update task status: {status_response.status}")
+                        print(await status_response.text())
             
             print("Task simulation completed")
             return task_id
-        else:
-            print(f"Failed to create task: {response.status_code}")
-            print(response.text)
-            return None
     except Exception as e:
         print(f"Error: {str(e)}")
         return None
@@ -83,4 +78,4 @@ if __name__ == "__main__":
     
     args = parser.parse_args()
     
-    create_task(args.host, args.port, args.token)
\ No newline at end of file
+    asyncio.run(create_task(args.host, args.port, args.token))
\ No newline at end of file
@@ -3,9 +3,12 @@ import asyncio
 import argparse
 import sys
 import json
-from src.knowledge_base.security_kb import SecurityKnowledgeBase
+from itertools import zip_longest
+from typing import Literal
 
-async def query_knowledge_base(query_text, collection_type, limit=5):
+CollectionType = Literal["attack", "vuln", "service"]
+
+async def query_knowledge_base(query_text: str, collection_type: CollectionType, limit: int = 5):
     """
     Query the security knowledge base.
     
@@ -18,30 +21,38 @@ async def query_knowledge_base(query_text, collection_type, limit=5):
     print(f"Collection type: {collection_type}")
     print(f"Limit: {limit}")
     
+    # Imported here so --help and argument errors don't load ChromaDB and
+    # the embedding model
+    from src.knowledge_base.security_kb import SecurityKnowledgeBase
+    
     kb = SecurityKnowledgeBase()
     
-    if collection_type == "attack":
-        results = kb.query_attack_patterns(query_text, n_results=limit)
-    elif collection_type == "vuln":
-        results = kb.query_vulnerabilities(query_text, n_results=limit)
-    elif collection_type == "service":
-        results = kb.query_service_fingerprints(query_text, n_results=limit)
-    else:
+    dispatch = {
+        "attack": kb.query_attack_patterns,
+        "vuln": kb.query_vulnerabilities,
+        "service": kb.query_service_fingerprints,
+    }
+    query = dispatch.get(collection_type)
+    if query is None:
         print(f"Unknown collection type: {collection_type}")
         return False
     
+    results = query(query_text, n_results=limit)
+    
     # Print results
-    if results and results.get("documents") and len(results["documents"][0]) > 0:
-        print(f"\nFound {len(results['documents'][0])} results:")
-        for i, doc in enumerate(results["documents"][0]):
-            print(f"\n--- Result {i+1} ---")
-            print(f"Document: {doc[:200]}...")
-            if i < len(results["metadatas"][0]):
-                print(f"Metadata: {json.dumps(results['metadatas'][0][i], indent=2)}")
-        return True
-    else:
+    docs = (results.get("documents") or [[]])[0] if results else []
+    if not docs:
         print("No results found")
         return False
+    
+    metadatas = (results.get("metadatas") or [[]])[0]
+    print(f"\nFound {len(docs)} results:")
+    for i, (doc, metadata) in enumerate(zip_longest(docs, metadatas[:len(docs)]), 1):
+        print(f"\n--- Result {i} ---")
+        print(f"Document: {doc[:200]}...")
+        if metadata is not None:
+            print(f"Metadata: {json.dumps(metadata, indent=2)}")
+    return True
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Query the security knowledge base")
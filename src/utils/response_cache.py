@@ -0,0 +1,66 @@
+import hashlib
+import sqlite3
+import time
+from typing import Optional, Tuple
+from src.utils.claude_client import ClaudeClient
+
+# Local cache of Claude responses, so re-running a check doesn't repeat API calls
+CACHE_PATH = "claude_cache.db"
+
+# Cached responses older than this (in seconds) are fetched again
+CACHE_TTL = 7 * 24 * 3600
+
+_conn: Optional[sqlite3.Connection] = None
+
+def _get_conn() -> sqlite3.Connection:
+    """Open the cache database on first use"""
+    global _conn
+    if _conn is None:
+        _conn = sqlite3.connect(CACHE_PATH)
+        _conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, text TEXT NOT NULL, ts REAL NOT NULL)"
+        )
+    return _conn
+
+async def cached_generate(
+    client: ClaudeClient,
+    system_prompt: str,
+    user_message: str,
+    model: Optional[str] = None,
+    refresh: bool = False
+) -> Tuple[str, bool]:
+    """
+    Generate a response from Claude, reusing a cached one for the same prompt.
+    
+    Args:
+        client: Claude client used on a cache miss
+        system_prompt: The system prompt to guide Claude's behavior
+        user_message: The user's message
+        model: The Claude model to use, defaults to the client's default model
+        refresh: Always call the API, replacing any cached response
+        
+    Returns:
+        Claude's response text and whether it came from the cache
+    """
+    model = model or client.default_model
+    key = hashlib.sha256("\0".join((model, system_prompt, user_message)).encode()).hexdigest()
+    
+    conn = _get_conn()
+    if not refresh:
+        row = conn.execute("SELECT text, ts FROM responses WHERE key = ?", (key,)).fetchone()
+        if row and time.time() - row[1] < CACHE_TTL:
+            return row[0], True
+    
+    text = await client.generate_response(
+        system_prompt=system_prompt,
+        user_message=user_message,
+        model=model
+    )
+    
+    with conn:
+        conn.execute(
+            "INSERT OR REPLACE INTO responses (key, text, ts) VALUES (?, ?, ?)",
+            (key, text, time.time())
+        )
+    
+    return text, False
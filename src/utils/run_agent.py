@@ -1,11 +1,29 @@
 #!/usr/bin/env python3
 import asyncio
 import argparse
+import importlib
 import sys
 import os
-from src.agents.reconnaissance_agent import ReconnaissanceAgent
-from src.agents.knowledge_base_agent import KnowledgeBaseAgent
-from src.agents.vulnerability_discovery_agent import VulnerabilityDiscoveryAgent
+
+# Agent classes by type as (module, class name), imported only when selected
+AGENTS = {
+    "reconnaissance": ("src.agents.reconnaissance_agent", "ReconnaissanceAgent"),
+    "knowledge_base": ("src.agents.knowledge_base_agent", "KnowledgeBaseAgent"),
+    "vulnerability_discovery": ("src.agents.vulnerability_discovery_agent", "VulnerabilityDiscoveryAgent"),
+}
+
+
+def load_agent_class(agent_type: str):
+    """
+    Import and return the agent class for an agent type.
+
+    Args:
+        agent_type: Type of agent (e.g., "reconnaissance")
+
+    Returns: Agent class
+    """
+    module_name, class_name = AGENTS[agent_type]
+    return getattr(importlib.import_module(module_name), class_name)
 
 
 async def run_agent(agent_type: str, agent_id: str = None):
@@ -20,19 +38,13 @@ async def run_agent(agent_type: str, agent_id: str = None):
     """
     print(f"Starting {agent_type} agent...")
 
-    if agent_type == "reconnaissance":
-        agent = ReconnaissanceAgent(agent_id=agent_id)
-        await agent.start()
-    elif agent_type == "knowledge_base":
-        agent = KnowledgeBaseAgent(agent_id=agent_id)
-        await agent.start()
-    elif agent_type == "vulnerability_discovery":
-        agent = VulnerabilityDiscoveryAgent(agent_id=agent_id)
-        await agent.start()
-    else:
+    if agent_type not in AGENTS:
         print(f"Unknown agent type: {agent_type}")
         return
 
+    agent = load_agent_class(agent_type)(agent_id=agent_id)
+    await agent.start()
+
     print(f"{agent_type} agent stopped.")
 
 if __name__ == "__main__":
@@ -3,14 +3,15 @@ import asyncio
 import aiohttp
 import json
 import uuid
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 class AgentWorkflowTester:
     """
     Test utility for the agent workflow.
     
     This class creates a task, waits for its completion, and retrieves the results,
-    demonstrating the end-to-end flow of the agent system.
+    demonstrating the end-to-end flow of the agent system. Use it as an async
+    context manager so all calls share one HTTP session.
     """
     
     def __init__(self, host="localhost", port=8000, token="dev_token"):
@@ -27,6 +28,31 @@ class AgentWorkflowTester:
             "Authorization": f"Bearer {token}",
             "Content-Type": "application/json"
         }
+        
+        # Last status response and its ETag, reused when the server answers 304
+        self._etag: Optional[str] = None
+        self._last_status: Optional[Dict[str, Any]] = None
+        
+        # HTTP session shared by all requests, opened in __aenter__
+        self._session: Optional[aiohttp.ClientSession] = None
+    
+    async def __aenter__(self):
+        """
+        Open the HTTP session used for all API calls.
+        """
+        self._session = aiohttp.ClientSession(
+            base_url=self.base_url,
+            headers=self.headers,
+            connector=aiohttp.TCPConnector(limit=32, keepalive_timeout=60)
+        )
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        """
+        Close the HTTP session.
+        """
+        await self._session.close()
+        self._session = None
     
     async def create_task(self) -> str:
         """
@@ -47,20 +73,15 @@ class AgentWorkflowTester:
             "priority": 2
         }
         
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                f"{self.base_url}/api/task/create",
-                headers=self.headers,
-                json=task_data
-            ) as response:
-                if response.status == 200:
-                    result = await response.json()
-                    task_id = result["task_id"]
-                    print(f"Created task with ID: {task_id}")
-                    return task_id
-                else:
-                    text = await response.text()
-                    raise Exception(f"Failed to create task: {response.status} - {text}")
+        async with self._session.post("/api/task/create", json=task_data) as response:
+            if response.status == 200:
+                result = await response.json()
+                task_id = result["task_id"]
+                print(f"Created task with ID: {task_id}")
+                return task_id
+            else:
+                text = await response.text()
+                raise Exception(f"Failed to create task: {response.status} - {text}")
     
     async def get_task_status(self, task_id: str) -> Dict[str, Any]:
         """
@@ -71,16 +92,18 @@ class AgentWorkflowTester:
             
         Returns: Dictionary with task status information
         """
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                f"{self.base_url}/api/task/{task_id}/status",
-                headers=self.headers
-            ) as response:
-                if response.status == 200:
-                    return await response.json()
-                else:
-                    text = await response.text()
-                    raise Exception(f"Failed to get task status: {response.status} - {text}")
+        headers = {"If-None-Match": self._etag} if self._etag else None
+        
+        async with self._session.get(f"/api/task/{task_id}/status", headers=headers) as response:
+            if response.status == 304:
+                return self._last_status
+            elif response.status == 200:
+                self._last_status = await response.json()
+                self._etag = response.headers.get("ETag")
+                return self._last_status
+            else:
+                text = await response.text()
+                raise Exception(f"Failed to get task status: {response.status} - {text}")
     
     async def get_task_result(self, task_id: str) -> Dict[str, Any]:
         """
@@ -91,23 +114,20 @@ class AgentWorkflowTester:
             
         Returns: Dictionary with task result
         """
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                f"{self.base_url}/api/task/{task_id}",
-                headers=self.headers
-            ) as response:
-                if response.status == 200:
-                    result = await response.json()
-                    return result.get("result", {})
-                else:
-                    text = await response.text()
-                    raise Exception(f"Failed to get task result: {response.status} - {text}")
+        async with self._session.get(f"/api/task/{task_id}") as response:
+            if response.status == 200:
+                result = await response.json()
+                return result.get("result", {})
+            else:
+                text = await response.text()
+                raise Exception(f"Failed to get task result: {response.status} - {text}")
     
     async def wait_for_task_completion(self, task_id: str, timeout=60) -> Dict[str, Any]:
         """
         Wait for a task to complete.
         
-        Polls the task status until it's completed or failed, or until timeout.
+        Polls the task status with exponential backoff until it's completed
+        or failed, or until timeout.
         
         Args:
             task_id: ID of the task to wait for
@@ -115,7 +135,9 @@ class AgentWorkflowTester:
             
         Returns: Final task status dictionary
         """
-        start_time = asyncio.get_event_loop().time()
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
+        attempt = 0
         while True:
             status = await self.get_task_status(task_id)
             
@@ -125,12 +147,12 @@ class AgentWorkflowTester:
                 return status
             
             # Check timeout
-            current_time = asyncio.get_event_loop().time()
-            if current_time - start_time > timeout:
+            if loop.time() - start_time > timeout:
                 raise TimeoutError(f"Timeout waiting for task completion after {timeout} seconds")
             
-            # Wait before checking again
-            await asyncio.sleep(2)
+            # Back off exponentially before checking again, up to 2 seconds
+            await asyncio.sleep(min(2.0, 0.25 * 2 ** attempt))
+            attempt += 1
     
     async def run_test(self):
         """
@@ -159,6 +181,9 @@ class AgentWorkflowTester:
         except Exception as e:
             print(f"Error during test: {e}")
 
+async def main():
+    async with AgentWorkflowTester() as tester:
+        await tester.run_test()
+
 if __name__ == "__main__":
-    tester = AgentWorkflowTester()
-    asyncio.run(tester.run_test())
\ No newline at end of file
+    asyncio.run(main())
\ No newline at end of file
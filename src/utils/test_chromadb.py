@@ -1,20 +1,34 @@
 #!/usr/bin/env python3
-import asyncio
+import argparse
 import sys
+from typing import List, Optional
 from src.knowledge_base.base_kb import BaseKnowledgeBase
 
-async def test_chromadb_connection():
+# Knowledge base shared by every check in the process, so the ChromaDB
+# client and embedding model are only set up once
+_kb_singleton = None
+
+def _get_kb() -> BaseKnowledgeBase:
+    global _kb_singleton
+    _kb_singleton = _kb_singleton or BaseKnowledgeBase()
+    return _kb_singleton
+
+def check_chromadb_connection(texts: Optional[List[str]] = None):
     """
-    Test the connection to ChromaDB.
+    Check the connection to ChromaDB.
     
-    Creates a test collection, adds a document, and queries it to verify
-    the connection is working properly.
+    Creates a test collection, adds documents in a single batch, and queries
+    them to verify the connection is working properly.
+    
+    Args:
+        texts: Documents to add; defaults to a single test document
     """
     print("Testing ChromaDB connection...")
     
+    texts = texts or ["This is a test document for ChromaDB connection verification."]
+    
     try:
-        # Create knowledge base
-        kb = BaseKnowledgeBase()
+        kb = _get_kb()
         
         # List collections
         collections = kb.client.list_collections()
@@ -24,15 +38,14 @@ async def test_chromadb_connection():
         test_collection = kb.create_collection("test_collection", overwrite=True)
         print(f"Created test collection: {test_collection.name}")
         
-        # Add a document
-        test_text = "This is a test document for ChromaDB connection verification."
+        # Add the documents in one call
         kb.add_texts(
             collection_name="test_collection",
-            texts=[test_text],
-            metadatas=[{"source": "test"}],
-            ids=["test1"]
+            texts=texts,
+            metadatas=[{"source": "test"} for _ in texts],
+            ids=[f"test{i + 1}" for i in range(len(texts))]
         )
-        print("Added test document")
+        print(f"Added {len(texts)} test document(s)")
         
         # Query the document
         results = kb.query_texts(
@@ -56,5 +69,15 @@ async def test_chromadb_connection():
         return False
 
 if __name__ == "__main__":
-    success = asyncio.run(test_chromadb_connection())
+    parser = argparse.ArgumentParser(description="Test the ChromaDB connection")
+    parser.add_argument("--batch", type=int, default=1,
+                        help="Number of synthetic documents to add in one batch")
+    
+    args = parser.parse_args()
+    
+    texts = None
+    if args.batch > 1:
+        texts = [f"Synthetic test document {i} for ChromaDB batch insertion." for i in range(args.batch)]
+    
+    success = check_chromadb_connection(texts)
     sys.exit(0 if success else 1)
\ No newline at end of file
@@ -1,19 +1,26 @@
+import argparse
 import asyncio
-from claude_client import ClaudeClient
+from src.utils.claude_client import ClaudeClient
+from src.utils.response_cache import cached_generate
 
-async def test_claude_integration():
+async def test_claude_integration(refresh: bool = False):
     client = ClaudeClient()
     
     system_prompt = "You are a cybersecurity expert analyzing reconnaissance data."
     user_message = "Analyze this port scan result: Port 22/tcp open ssh OpenSSH 8.2"
     
-    response = await client.generate_response(
-        system_prompt=system_prompt,
-        user_message=user_message
-    )
+    # Identical prompts on re-runs are answered from the local cache unless refreshed
+    response, cached = await cached_generate(client, system_prompt, user_message, refresh=refresh)
     
-    print("Claude Response:")
+    # A cached answer doesn't prove the API key or network work
+    print("Claude Response (cached, rerun with --refresh to call the API):" if cached else "Claude Response:")
     print(response)
 
 if __name__ == "__main__":
-    asyncio.run(test_claude_integration())
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Check the Claude API integration")
+    parser.add_argument("--refresh", action="store_true",
+                        help="Call the API even if a cached response exists")
+    
+    args = parser.parse_args()
+    
+    asyncio.run(test_claude_integration(args.refresh))
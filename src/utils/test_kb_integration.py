@@ -13,7 +13,7 @@ async def test_kb_integration():
 
     This test:
     1. Initializes the knowledge base with sample data
-    2. Creates a KB-enhanced reconnaissance agent
+    2. Creates a KB-enhanced reconnaissance agent (concurrently with step 1)
     3. Simulates processing a task
     4. Verifies that the results include enriched information
     """
@@ -21,12 +21,15 @@ async def test_kb_integration():
     print("Initializing security knowledge base...")
     kb = SecurityKnowledgeBase()
     importer = SecurityDataImporter(kb)
-    import_results = importer.import_all_data()
-    print(f"Imported {import_results['total']} items into knowledge base")
 
-    # Create KB-enhanced reconnaissance agent
-    print("\nCreating KB-enhanced reconnaissance agent...")
-    agent = KBReconnaissanceAgent(agent_id="test_recon_agent")
+    # Import the sample data while the KB-enhanced reconnaissance agent is
+    # created; both block on ChromaDB and embedding work, so run them in threads
+    print("Importing sample data and creating KB-enhanced reconnaissance agent...")
+    import_results, agent = await asyncio.gather(
+        asyncio.to_thread(importer.import_all_data),
+        asyncio.to_thread(KBReconnaissanceAgent, agent_id="test_recon_agent")
+    )
+    print(f"Imported {import_results['total']} items into knowledge base")
 
     # Create a simulated task
     task = {
@@ -1,10 +1,42 @@
 #!/usr/bin/env python3
 import asyncio
 import aiohttp
-import json
+import orjson
 import argparse
+import random
 import sys
-import time
+import websockets
+
+# HTTP session shared by every WorkflowTester in the process, so all of them
+# reuse one connection pool and DNS cache
+_session = None
+_session_lock = asyncio.Lock()
+
+
+async def _get_session():
+    """
+    Get the shared HTTP session, creating it on first use.
+
+    Returns: Shared aiohttp.ClientSession
+    """
+    global _session
+    async with _session_lock:
+        if _session is None or _session.closed:
+            _session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=30),
+                connector=aiohttp.TCPConnector(limit=64, ttl_dns_cache=300, keepalive_timeout=75)
+            )
+        return _session
+
+
+async def close_session():
+    """
+    Close the shared HTTP session, if one is open.
+    """
+    global _session
+    if _session is not None:
+        await _session.close()
+        _session = None
 
 
 class WorkflowTester:
@@ -12,7 +44,9 @@ class WorkflowTester:
     Test utility for multi-agent workflows.
 
     This class provides functionality to test the recon_vuln workflow
-    that chains reconnaissance and vulnerability discovery.
+    that chains reconnaissance and vulnerability discovery. Use it as an
+    async context manager; all testers share one HTTP session, closed with
+    close_session().
     """
 
     def __init__(self, host="localhost", port=8000, token="dev_token"):
@@ -25,11 +59,66 @@ class WorkflowTester:
             token: Authentication token for API calls
         """
         self.base_url = f"http://{host}:{port}"
+        self.ws_url = f"ws://{host}:{port}/ws/task-updates"
         self.headers = {
             "Authorization": f"Bearer {token}",
             "Content-Type": "application/json"
         }
 
+        # Fixed part of every workflow request; only the target varies
+        self._workflow_template = {
+            "scope": {
+                "ip_range": "192.168.1.0/24",
+                "excluded_ips": [],
+                "excluded_ports": [],
+                "max_depth": 2
+            },
+            "description": "Test security assessment"
+        }
+
+        # Shared HTTP session, acquired in __aenter__
+        self._session = None
+
+    async def __aenter__(self):
+        """
+        Acquire the shared HTTP session used for all API calls.
+        """
+        self._session = await _get_session()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        """
+        Release the shared HTTP session; it stays open for other testers.
+        """
+        self._session = None
+
+    async def _request(self, method, path, action, **kwargs):
+        """
+        Send an API request and decode its JSON response.
+
+        The body is read once and parsed with orjson on success, or
+        included in the error otherwise.
+
+        Args:
+            method: HTTP method
+            path: API path, relative to the server's base URL
+            action: Description of the call for error messages
+            **kwargs: Extra arguments for the request (e.g. data)
+
+        Returns: Decoded response body
+        """
+        async with self._session.request(
+                method,
+                f"{self.base_url}{path}",
+                headers=self.headers,
+                **kwargs
+        ) as response:
+            body = await response.read()
+            if response.status == 200:
+                return orjson.loads(body)
+            raise RuntimeError(
+                f"Failed to {action}: {response.status} - {body[:512].decode(errors='replace')}")
+
     async def create_workflow(self, target="192.168.1.1"):
         """
         Create a reconnaissance and vulnerability discovery workflow.
@@ -39,31 +128,13 @@ class WorkflowTester:
 
         Returns: Workflow ID if successful
         """
-        workflow_data = {
-            "target": target,
-            "scope": {
-                "ip_range": "192.168.1.0/24",
-                "excluded_ips": [],
-                "excluded_ports": [],
-                "max_depth": 2
-            },
-            "description": "Test security assessment"
-        }
+        # Serialized up front; the headers already carry the JSON Content-Type
+        workflow_data = orjson.dumps({"target": target, **self._workflow_template})
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                    f"{self.base_url}/api/workflows/recon_vuln",
-                    headers=self.headers,
-                    json=workflow_data
-            ) as response:
-                if response.status == 200:
-                    result = await response.json()
-                    workflow_id = result.get("workflow_id")
-                    print(f"Created workflow with ID: {workflow_id}")
-                    return workflow_id
-                else:
-                    text = await response.text()
-                    raise Exception(f"Failed to create workflow: {response.status} - {text}")
+        result = await self._request("POST", "/api/workflows/recon_vuln", "create workflow", data=workflow_data)
+        workflow_id = result.get("workflow_id")
+        print(f"Created workflow with ID: {workflow_id}")
+        return workflow_id
 
     async def get_workflow_status(self, workflow_id):
         """
@@ -74,16 +145,7 @@ class WorkflowTester:
 
         Returns: Workflow status data
         """
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                    f"{self.base_url}/api/workflows/{workflow_id}",
-                    headers=self.headers
-            ) as response:
-                if response.status == 200:
-                    return await response.json()
-                else:
-                    text = await response.text()
-                    raise Exception(f"Failed to get workflow status: {response.status} - {text}")
+        return await self._request("GET", f"/api/workflows/{workflow_id}", "get workflow status")
 
     async def get_workflow_results(self, workflow_id):
         """
@@ -94,42 +156,153 @@ class WorkflowTester:
 
         Returns: Workflow results
         """
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                    f"{self.base_url}/api/workflows/{workflow_id}/results",
-                    headers=self.headers
-            ) as response:
-                if response.status == 200:
-                    return await response.json()
-                else:
-                    text = await response.text()
-                    raise Exception(f"Failed to get workflow results: {response.status} - {text}")
+        return await self._request("GET", f"/api/workflows/{workflow_id}/results", "get workflow results")
 
-    async def wait_for_workflow_completion(self, workflow_id, timeout=300, check_interval=5):
+    async def wait_for_workflow_completion(self, workflow_id, timeout=300):
         """
         Wait for a workflow to complete.
 
+        Listens on the task updates WebSocket for the workflow's status
+        changes instead of polling the workflow endpoint. Falls back to
+        polling if the WebSocket is unavailable or drops.
+
         Args:
             workflow_id: ID of the workflow
             timeout: Maximum seconds to wait
-            check_interval: Seconds between status checks
 
         Returns: Final workflow status
         """
-        start_time = time.time()
-        while time.time() - start_time < timeout:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+
+        try:
+            ws = await websockets.connect(
+                self.ws_url,
+                extra_headers={"Authorization": self.headers["Authorization"]}
+            )
+        except (OSError, websockets.exceptions.WebSocketException) as e:
+            print(f"Task updates WebSocket unavailable ({e}), polling instead")
+            return await self._poll_workflow_completion(workflow_id, deadline)
+
+        try:
+            # Connected before checking, so a completion in between isn't missed
+            status = await self.get_workflow_status(workflow_id)
+
+            print(f"Workflow status: {status.get('status')}")
+            print(f"Tasks: {len(status.get('tasks', []))}")
+
+            if status.get("status") in ["completed", "failed"]:
+                return status
+
+            try:
+                update = await asyncio.wait_for(
+                    self._wait_for_workflow_event(ws, workflow_id),
+                    timeout=deadline - loop.time()
+                )
+            except asyncio.TimeoutError:
+                raise TimeoutError(f"Workflow did not complete within {timeout} seconds")
+            except websockets.exceptions.ConnectionClosed:
+                update = None
+
+            if update:
+                return update
+        finally:
+            await ws.close()
+
+        print("Task updates WebSocket closed, polling instead")
+        return await self._poll_workflow_completion(workflow_id, deadline)
+
+    async def _poll_workflow_completion(self, workflow_id, deadline):
+        """
+        Poll the workflow status with exponential backoff until it finishes.
+
+        Starts at a short interval so quick workflows are seen promptly and
+        doubles it (with jitter) up to 30 seconds for long-running ones.
+
+        Args:
+            workflow_id: ID of the workflow
+            deadline: Event loop time by which the workflow must finish
+
+        Returns: Final workflow status
+        """
+        loop = asyncio.get_running_loop()
+        interval = 0.25
+        while loop.time() < deadline:
             status = await self.get_workflow_status(workflow_id)
 
             print(f"Workflow status: {status.get('status')}")
             print(f"Tasks: {len(status.get('tasks', []))}")
 
-            if status.get("status") == "completed":
+            if status.get("status") in ["completed", "failed"]:
                 return status
 
             # Wait before checking again
-            await asyncio.sleep(check_interval)
+            await asyncio.sleep(interval + random.uniform(0, interval * 0.1))
+            interval = min(interval * 2, 30)
+
+        raise TimeoutError("Workflow did not complete before the deadline")
 
-        raise TimeoutError(f"Workflow did not complete within {timeout} seconds")
+    async def _wait_for_workflow_event(self, ws, workflow_id):
+        """
+        Read task updates until the workflow completes or fails.
+
+        Args:
+            ws: Open connection to the task updates WebSocket
+            workflow_id: ID of the workflow
+
+        Returns: Final workflow status event
+        """
+        async for raw in ws:
+            update = orjson.loads(raw)
+            if update.get("workflow_id") != workflow_id:
+                continue
+
+            print(f"Workflow status: {update.get('status')}")
+
+            if update.get("status") in ["completed", "failed"]:
+                return update
+
+    @staticmethod
+    def _format_task(task):
+        """
+        Render a workflow task and its results for display.
+
+        Args:
+            task: Task entry from the workflow results
+
+        Returns: List of output lines
+        """
+        lines = [f"\nTask: {task.get('task_type')}", f"Status: {task.get('status')}"]
+
+        result = task.get("result")
+        if not result:
+            return lines
+
+        if "summary" in result:
+            lines.append(f"\nSummary: {result.get('summary')}")
+
+        if task.get("task_type") == "vulnerability_discovery":
+            vulns = result.get("vulnerability_findings", [])
+            total_vulns = result.get("total_vulnerabilities", 0)
+            lines.append(f"\nFound {total_vulns} vulnerabilities across {len(vulns)} services:")
+
+            for service in vulns:
+                service_vulns = service.get("vulnerabilities", [])
+                lines.append(
+                    f"\n- {service.get('service')} {service.get('version')} on port {service.get('port')}")
+                lines.append(
+                    f"  {service.get('total_vulnerabilities')} vulnerabilities found (highest risk: {service.get('highest_risk')})")
+
+                # Show top 3 vulnerabilities
+                lines.extend(
+                    f"  - {vuln.get('name')} (CVE: {vuln.get('cve_id')}, CVSS: {vuln.get('cvss_score')})"
+                    for vuln in service_vulns[:3]
+                )
+
+                if len(service_vulns) > 3:
+                    lines.append(f"    ... and {len(service_vulns) - 3} more")
+
+        return lines
 
     async def run_test(self, target="192.168.1.1", wait_for_completion=True):
         """
@@ -148,53 +321,37 @@ class WorkflowTester:
             # Wait for completion if requested
             if wait_for_completion:
                 print(f"Waiting for workflow {workflow_id} to complete...")
-                await self.wait_for_workflow_completion(workflow_id)
+                final_status = await self.wait_for_workflow_completion(workflow_id)
 
-                # Get results
+                # The wait already reported the final status, so only the
+                # results need fetching
                 results = await self.get_workflow_results(workflow_id)
 
-                print("\nWorkflow completed!")
-                print(f"Target: {results.get('target')}")
+                lines = [f"\nWorkflow {final_status.get('status')}!", f"Target: {results.get('target')}"]
 
                 # Print task results
                 for task in results.get("tasks", []):
-                    print(f"\nTask: {task.get('task_type')}")
-                    print(f"Status: {task.get('status')}")
-
-                    if task.get("result"):
-                        result = task.get("result")
-                        if "summary" in result:
-                            print(f"\nSummary: {result.get('summary')}")
-
-                        if task.get("task_type") == "vulnerability_discovery":
-                            vulns = result.get("vulnerability_findings", [])
-                            total_vulns = result.get("total_vulnerabilities", 0)
-                            print(f"\nFound {total_vulns} vulnerabilities across {len(vulns)} services:")
-
-                            for service in vulns:
-                                print(
-                                    f"\n- {service.get('service')} {service.get('version')} on port {service.get('port')}")
-                                print(
-                                    f"  {service.get('total_vulnerabilities')} vulnerabilities found (highest risk: {service.get('highest_risk')})")
-
-                                # Show top vulnerabilities
-                                for vuln in service.get("vulnerabilities", [])[:3]:  # Show top 3
-                                    print(
-                                        f"  - {vuln.get('name')} (CVE: {vuln.get('cve_id')}, CVSS: {vuln.get('cvss_score')})")
-
-                                if len(service.get("vulnerabilities", [])) > 3:
-                                    print(f"    ... and {len(service.get('vulnerabilities', [])) - 3} more")
-
-                    return results
-                else:
-                    print(f"Workflow {workflow_id} started. Not waiting for completion.")
-                    return {"workflow_id": workflow_id}
+                    lines.extend(self._format_task(task))
+
+                sys.stdout.write("\n".join(lines) + "\n")
+                return results
+            else:
+                print(f"Workflow {workflow_id} started. Not waiting for completion.")
+                return {"workflow_id": workflow_id}
 
         except Exception as e:
             print(f"Error during workflow test: {e}")
             return None
 
 
+async def main(target, wait_for_completion):
+    try:
+        async with WorkflowTester() as tester:
+            await tester.run_test(target, wait_for_completion)
+    finally:
+        await close_session()
+
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Test multi-agent workflow")
     parser.add_argument("--target", default="192.168.1.1", help="Target IP or hostname")
@@ -202,5 +359,4 @@ if __name__ == "__main__":
 
     args = parser.parse_args()
 
-    tester = WorkflowTester()
-    asyncio.run(tester.run_test(args.target, not args.no_wait))
+    asyncio.run(main(args.target, not args.no_wait))
@@ -1,10 +1,52 @@
 #!/usr/bin/env python3
 import asyncio
 import argparse
-import json
+import orjson
 import sys
-from src.mcp_server.message_bus import MessageBus
-from src.utils.config import Config
+import redis.asyncio as redis
+from src.mcp_server.message_bus import MESSAGE_INDEX_KEY
+from src.utils.config import get_config
+
+# Message IDs read from the index per round trip when filtering by agent
+INDEX_PAGE_SIZE = 100
+
+
+async def load_recent_messages(client, limit, agent_id=None):
+    """
+    Load the newest messages, optionally only those sent to or by an agent.
+
+    Walks the message bus's send-time index newest first, so only the
+    messages needed are fetched and parsed.
+
+    Args:
+        client: Redis client
+        limit: Maximum number of messages to return
+        agent_id: Optional agent ID to filter messages
+
+    Returns: List of message dictionaries, newest first
+    """
+    page_size = limit if agent_id is None else max(limit, INDEX_PAGE_SIZE)
+    messages = []
+    start = 0
+
+    while len(messages) < limit:
+        message_ids = await client.zrevrange(MESSAGE_INDEX_KEY, start, start + page_size - 1)
+        if not message_ids:
+            break
+        start += len(message_ids)
+
+        message_keys = [f"message:{message_id.decode()}" for message_id in message_ids]
+        for message_data in await client.mget(message_keys):
+            if not message_data:
+                continue
+
+            message = orjson.loads(message_data)
+            if agent_id is None or agent_id in (message.get("recipient_id"), message.get("sender_id")):
+                messages.append(message)
+                if len(messages) == limit:
+                    break
+
+    return messages
 
 
 async def view_recent_messages(agent_id=None, limit=10):
@@ -17,28 +59,19 @@ async def view_recent_messages(agent_id=None, limit=10):
     """
     print(f"Viewing recent messages{f' for agent {agent_id}' if agent_id else ''}")
 
-    # Initialize message bus
-    message_bus = MessageBus()
+    # Read-only viewing needs neither the message bus nor a connection pool;
+    # a single connection is enough
+    config = get_config()
+    client = redis.Redis(
+        host=config.REDIS_HOST,
+        port=config.REDIS_PORT,
+        db=config.REDIS_DB,
+        single_connection_client=True
+    )
 
     try:
         # Get recent messages
-        if agent_id:
-            messages = await message_bus.get_messages_for_agent(agent_id, limit)
-        else:
-            # Get all messages (simplified implementation)
-            message_keys = await message_bus.redis.keys("message:*")
-            messages = []
-
-            for key in message_keys:
-                message_data = await message_bus.redis.get(key)
-                if message_data:
-                    messages.append(json.loads(message_data))
-
-            # Sort by timestamp (newest first)
-            messages.sort(key=lambda m: m.get("timestamp", ""), reverse=True)
-
-            # Limit number of messages
-            messages = messages[:limit]
+        messages = await load_recent_messages(client, limit, agent_id)
 
         # Display messages
         if messages:
@@ -55,12 +88,14 @@ async def view_recent_messages(agent_id=None, limit=10):
 
                 print("\nContent:")
                 content = message.get("content", {})
-                print(json.dumps(content, indent=2))
+                print(orjson.dumps(content, option=orjson.OPT_INDENT_2).decode())
         else:
             print("No messages found")
 
     except Exception as e:
         print(f"Error viewing messages: {e}")
+    finally:
+        await client.close()
 
 
 if __name__ == "__main__":
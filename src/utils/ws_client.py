@@ -1,18 +1,18 @@
 #!/usr/bin/env python3
 import asyncio
 import websockets
-import json
+import orjson
 import sys
 
 async def connect_to_server():
     uri = "ws://localhost:8000/ws/task-updates"
-    async with websockets.connect(uri) as websocket:
+    # Keepalive pings stop idle connections from being dropped between updates
+    async with websockets.connect(uri, ping_interval=20, ping_timeout=20, max_size=None) as websocket:
         print("Connected to WebSocket server. Waiting for updates...")
         
-        while True:
-            message = await websocket.recv()
-            data = json.loads(message)
-            print(f"Received update: {json.dumps(data, indent=2)}")
+        async for message in websocket:
+            data = orjson.loads(message)
+            print(f"Received update: {orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()}")
 
 if __name__ == "__main__":
     try:
@@ -2,37 +2,60 @@ import pytest
 from fastapi.testclient import TestClient
 from src.mcp_server.app import app
 
-client = TestClient(app)
+AUTH_OK = {"Authorization": "Bearer dev_token", "Content-Type": "application/json"}
+AUTH_BAD = {"Authorization": "Bearer invalid_token"}
 
-def test_root():
+RECON_PAYLOAD = {
+    "type": "reconnaissance",
+    "target": "192.168.1.1",
+    "scope": {"ip_range": "192.168.1.0/24"},
+    "description": "Test reconnaissance"
+}
+
+@pytest.fixture(scope="module")
+def client():
+    # Entering the client runs the app's startup and shutdown events once
+    with TestClient(app) as c:
+        yield c
+
+def test_root(client):
     response = client.get("/")
     assert response.status_code == 200
     assert "message" in response.json()
 
-def test_create_task_unauthorized():
-    response = client.post(
-        "/api/task/create",
-        headers={"Authorization": "Bearer invalid_token"},
-        json={
-            "type": "reconnaissance",
-            "target": "192.168.1.1",
-            "scope": {"ip_range": "192.168.1.0/24"},
-            "description": "Test reconnaissance"
-        }
-    )
+def test_create_task_unauthorized(client):
+    response = client.post("/api/task/create", headers=AUTH_BAD, json=RECON_PAYLOAD)
     assert response.status_code == 401
 
-def test_create_task_authorized():
-    response = client.post(
-        "/api/task/create",
-        headers={"Authorization": "Bearer dev_token"},
-        json={
-            "type": "reconnaissance",
-            "target": "192.168.1.1",
-            "scope": {"ip_range": "192.168.1.0/24"},
-            "description": "Test reconnaissance"
-        }
-    )
+def test_create_task_authorized(client):
+    response = client.post("/api/task/create", headers=AUTH_OK, json=RECON_PAYLOAD)
     assert response.status_code == 200
     assert "task_id" in response.json()
-    assert response.json()["status"] == "created"
\ No newline at end of file
+    assert response.json()["status"] == "created"
+def test_update_task_status_invalid(client):
+    task_id = client.post("/api/task/create", headers=AUTH_OK, json=RECON_PAYLOAD).json()["task_id"]
+    response = client.put(f"/api/task/{task_id}/status", headers=AUTH_OK, json={"status": "bogus"})
+    assert response.status_code == 400
+
+def test_task_status_etag(client):
+    task_id = client.post("/api/task/create", headers=AUTH_OK, json=RECON_PAYLOAD).json()["task_id"]
+    response = client.get(f"/api/task/{task_id}/status", headers=AUTH_OK)
+    assert response.status_code == 200
+    assert response.headers["ETag"]
+
+def test_task_status_not_modified(client):
+    task_id = client.post("/api/task/create", headers=AUTH_OK, json=RECON_PAYLOAD).json()["task_id"]
+    etag = client.get(f"/api/task/{task_id}/status", headers=AUTH_OK).headers["ETag"]
+    response = client.get(f"/api/task/{task_id}/status", headers={**AUTH_OK, "If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["ETag"] == etag
+
+def test_task_status_etag_changes(client):
+    task_id = client.post("/api/task/create", headers=AUTH_OK, json=RECON_PAYLOAD).json()["task_id"]
+    etag = client.get(f"/api/task/{task_id}/status", headers=AUTH_OK).headers["ETag"]
+    client.put(f"/api/task/{task_id}/status", headers=AUTH_OK, json={"status": "in_progress", "progress": 50.0})
+    response = client.get(f"/api/task/{task_id}/status", headers={**AUTH_OK, "If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert response.json()["status"] == "in_progress"
@@ -0,0 +1,25 @@
+import orjson
+from src.mcp_server.message_bus import MessageBus
+
+KNOWLEDGE_QUERY = {
+    "message_id": "123e4567-e89b-12d3-a456-426614174000",
+    "sender_id": "recon_agent",
+    "recipient_id": "knowledge_base_agent",
+    "message_type": "knowledge_query",
+    "content": {"query": "vulnerabilities for Apache 2.4.41", "collection": "vulnerabilities"},
+    "timestamp": "2024-01-01T00:00:00"
+}
+
+def test_decode_message_valid():
+    message = MessageBus.decode_message(orjson.dumps(KNOWLEDGE_QUERY))
+    assert message["message_type"] == "knowledge_query"
+    assert message["content"]["query"] == "vulnerabilities for Apache 2.4.41"
+    assert message["message_id"] == KNOWLEDGE_QUERY["message_id"]
+
+def test_decode_message_invalid_content():
+    payload = dict(KNOWLEDGE_QUERY, content={"collection": "vulnerabilities"})
+    assert MessageBus.decode_message(orjson.dumps(payload)) is None
+
+def test_decode_message_unknown_type():
+    payload = dict(KNOWLEDGE_QUERY, message_type="unknown")
+    assert MessageBus.decode_message(orjson.dumps(payload)) is None